@@ -113,6 +113,112 @@ if __name__ == "__main__":
     print(fft(data.copy()))
 
 
+# # Casamento de padrões com curinga via FFT
+# Com curinga codificado como 0 e demais símbolos como 1..σ, a posição i casa
+# sse  Σ_j p_j·t_{i+j}·(p_j - t_{i+j})² = Σ p³t - 2·p²t² + p·t³ = 0.
+# São três correlações; somamos no domínio da frequência e fazemos uma só inversa.
+try:
+    import numpy as np
+except ImportError:  # o caminho NumPy é opcional
+    np = None
+
+def _ifft(a):
+    """Inversa via fft: ifft(x) = conj(fft(conj(x))) / n."""
+    n = len(a)
+    return [x.conjugate() / n for x in fft([x.conjugate() for x in a])]
+
+def _encode(text, pat, wildcard):
+    alphabet = sorted((set(text) | set(pat)) - {wildcard})
+    code = {ch: i + 1 for i, ch in enumerate(alphabet)}
+    code[wildcard] = 0
+    return [code[c] for c in text], [code[c] for c in pat]
+
+# Os coeficientes chegam a m·σ⁴; acima disso o float64 da FFT perde a
+# exatidão (um 0 vira ±0.5) e usamos convolução inteira exata.
+_FFT_SAFE_BOUND = 1 << 40
+
+def _conv_exact(a, b, bound):
+    """
+    Convolução inteira exata por substituição de Kronecker: empacota cada
+    vetor num único int (w bytes por coeficiente, com bound ≥ coeficiente)
+    e deixa a multiplicação de inteiros grandes do Python fazer o resto.
+    """
+    w = (bound.bit_length() + 7) // 8
+    pack = lambda xs: int.from_bytes(b"".join(x.to_bytes(w, "little") for x in xs), "little")
+    raw = (pack(a) * pack(b)).to_bytes(w * (len(a) + len(b) - 1), "little")
+    return [int.from_bytes(raw[i:i + w], "little") for i in range(0, len(raw), w)]
+
+def wildcard_match_naive(text: str, pat: str, wildcard: str = "?") -> list[int]:
+    """Referência O(n·m): testa posição a posição."""
+    n, m = len(text), len(pat)
+    return [i for i in range(n - m + 1)
+            if all(p == wildcard or t == wildcard or p == t
+                   for p, t in zip(pat, text[i:i + m]))]
+
+def wildcard_match_fft(text: str, pat: str, wildcard: str = "?",
+                       use_numpy: bool | None = None) -> list[int]:
+    """
+    Posições iniciais onde pat casa com text, com curingas em ambos,
+    em O(n log n). use_numpy=None usa NumPy se estiver instalado.
+    Se m·σ⁴ passar de _FFT_SAFE_BOUND (alfabetos grandes), troca a FFT em
+    float por _conv_exact para não perder casamentos por arredondamento.
+    """
+    n, m = len(text), len(pat)
+    if m == 0 or m > n:
+        return []
+    t, p = _encode(text, pat, wildcard)
+    p = p[::-1]  # correlação = convolução com o padrão invertido
+    bound = m * max(max(t), max(p), 1) ** 4
+    if bound > _FFT_SAFE_BOUND:
+        t2, t3 = [x * x for x in t], [x * x * x for x in t]
+        p2, p3 = [x * x for x in p], [x * x * x for x in p]
+        c1, c2, c3 = _conv_exact(p3, t, bound), _conv_exact(p2, t2, bound), _conv_exact(p, t3, bound)
+        return [i for i in range(n - m + 1)
+                if c1[i + m - 1] - 2 * c2[i + m - 1] + c3[i + m - 1] == 0]
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        size = 1 << (n + m - 1).bit_length()
+        T = np.array(t, dtype=np.float64)
+        P = np.array(p, dtype=np.float64)
+        f = lambda x: np.fft.rfft(x, size)
+        spec = f(P**3) * f(T) - 2 * f(P**2) * f(T**2) + f(P) * f(T**3)
+        sums = np.rint(np.fft.irfft(spec, size)[m - 1:n])
+        return np.flatnonzero(sums == 0).tolist()
+    size = 1
+    while size < n + m - 1:
+        size <<= 1
+    def f(xs, k):
+        return fft([complex(x**k, 0) for x in xs] + [0j] * (size - len(xs)))
+    Ft1, Ft2, Ft3 = f(t, 1), f(t, 2), f(t, 3)
+    Fp1, Fp2, Fp3 = f(p, 1), f(p, 2), f(p, 3)
+    spec = [a3 * b1 - 2 * a2 * b2 + a1 * b3
+            for a1, a2, a3, b1, b2, b3 in zip(Fp1, Fp2, Fp3, Ft1, Ft2, Ft3)]
+    sums = _ifft(spec)
+    return [i for i in range(n - m + 1) if round(sums[i + m - 1].real) == 0]
+
+# Exemplo
+if __name__ == "__main__":
+    print(wildcard_match_fft("ACGT?GACGTTG", "?CGT", use_numpy=False))  # [0, 6]
+    print(wildcard_match_naive("ACGT?GACGTTG", "?CGT"))                 # [0, 6]
+
+    import random, time
+    rnd = random.Random(0)
+    genome = "".join(rnd.choice("ACGT?" if rnd.random() < 0.05 else "ACGT")
+                     for _ in range(20_000))
+    motif = "".join(rnd.choice("ACGT") for _ in range(200))
+    motif = motif[:50] + "??" + motif[52:]
+    genome = genome[:9000] + motif + genome[9200:]
+    for name, fn in [("naive", wildcard_match_naive),
+                     ("fft puro", lambda a, b: wildcard_match_fft(a, b, use_numpy=False)),
+                     ("fft numpy", lambda a, b: wildcard_match_fft(a, b, use_numpy=True))]:
+        if name == "fft numpy" and np is None:
+            continue
+        t0 = time.perf_counter()
+        res = fn(genome, motif)
+        print(f"{name}: {time.perf_counter() - t0:.3f}s {res}")  # [9000]
+
+
 # # Algoritmo de Dínic e Edmonds-Karp (fluxo máximo)
 # 4. Fluxo Máximo – Edmonds–Karp e Dinic sem collections nem heapq
 
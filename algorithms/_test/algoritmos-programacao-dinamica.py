@@ -204,6 +204,7 @@ class TrieNode:
     def __init__(self):
         self.children = {}
         self.is_end = False
+        self.score = 0
 
 def build_trie(words: list[str]) -> TrieNode:
     root = TrieNode()
@@ -242,3 +243,1289 @@ if __name__ == "__main__":
     print(word_break("leetcode", ["leet","code"]))   # True
     print(word_break("applepenapple", ["apple","pen"]))  # True
     print(word_break("catsandog", ["cats","dog","sand","and","cat"]))  # False
+
+
+# 9. Word Break compilado – dicionário construído uma vez, segmentação em lote
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+class WordSegmenter:
+    """
+    Compila o dicionário num trie uma única vez e reaproveita-o em todas as
+    consultas (word_break reconstrói o trie a cada chamada).
+    words: lista de palavras (cada uma vale -1, ou seja, a melhor divisão
+    é a de menos palavras) ou dict palavra → score (ex.: log-probabilidade).
+    Exemplo:
+        >>> WordSegmenter({"apple": 2, "pen": 1, "applepen": 2}).segment("applepenapple")
+        ['apple', 'pen', 'apple']
+    """
+    def __init__(self, words):
+        self.words = dict(words) if isinstance(words, dict) else {w: -1.0 for w in words}
+        self.root = TrieNode()
+        for w, score in self.words.items():
+            node = self.root
+            for ch in w:
+                node = node.children.setdefault(ch, TrieNode())
+            node.is_end = True
+            node.score = score
+
+    def _ends(self, s, i):
+        """Gera (j, score) para cada palavra do dicionário em s[i:j]."""
+        node = self.root
+        for j in range(i, len(s)):
+            node = node.children.get(s[j])
+            if node is None:
+                return
+            if node.is_end:
+                yield j + 1, node.score
+
+    def can_segment(self, s: str) -> bool:
+        n = len(s)
+        dp = [False]*(n+1)
+        dp[0] = True
+        for i in range(n):
+            if dp[i]:
+                for j, _ in self._ends(s, i):
+                    dp[j] = True
+        return dp[n]
+
+    def segment(self, s: str) -> list[str] | None:
+        """Divisão de maior score total, ou None se s não é segmentável."""
+        n = len(s)
+        best = [None]*(n+1)
+        back = [0]*(n+1)
+        best[0] = 0.0
+        for i in range(n):
+            if best[i] is None:
+                continue
+            for j, score in self._ends(s, i):
+                if best[j] is None or best[i] + score > best[j]:
+                    best[j] = best[i] + score
+                    back[j] = i
+        if best[n] is None:
+            return None
+        res = []
+        j = n
+        while j > 0:
+            res.append(s[back[j]:j])
+            j = back[j]
+        return res[::-1]
+
+    def segment_many(self, strings, processes: int | None = 1, chunksize: int = 256,
+                     max_pending: int | None = None):
+        """
+        Gera as segmentações de um iterável de strings, na mesma ordem.
+        processes=1 roda no processo atual; caso contrário usa um pool em que
+        cada worker recompila o dicionário uma vez (no initializer).
+        Lê a entrada em lotes de chunksize, com no máximo max_pending lotes
+        em voo (padrão 2 por processo), então a memória é O(janela) mesmo
+        para milhões de strings (pool.map consumiria tudo antes).
+        """
+        if processes == 1:
+            yield from map(self.segment, strings)
+            return
+        if max_pending is None:
+            max_pending = 2 * (processes or os.cpu_count() or 1)
+        it = iter(strings)
+        pending = deque()
+        with ProcessPoolExecutor(processes, initializer=_init_segmenter,
+                                 initargs=(self.words,)) as pool:
+            while batch := list(islice(it, chunksize)):
+                pending.append(pool.submit(_segment_batch, batch))
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+_worker_segmenter = None
+
+def _init_segmenter(words):
+    global _worker_segmenter
+    _worker_segmenter = WordSegmenter(words)
+
+def _segment_batch(batch):
+    return [_worker_segmenter.segment(s) for s in batch]
+
+if __name__ == "__main__":
+    seg = WordSegmenter(["apple", "pen", "applepen", "cats", "dog", "sand", "and", "cat"])
+    print(seg.can_segment("catsandog"))      # False
+    print(seg.segment("applepenapple"))      # ['applepen', 'apple']
+    print(list(seg.segment_many(["catsanddog", "pen"], processes=2)))
+    # [['cat', 'sand', 'dog'], ['pen']]
+
+    import random, time
+    rnd = random.Random(0)
+    vocab = list({"".join(rnd.choice("abcdefgh") for _ in range(rnd.randint(2, 7))) for _ in range(20_000)})
+    queries = ["".join(rnd.choice(vocab) for _ in range(8)) for _ in range(30)]
+    t0 = time.perf_counter()
+    r1 = [word_break(q, vocab) for q in queries]
+    t1 = time.perf_counter()
+    seg = WordSegmenter(vocab)
+    r2 = [seg.can_segment(q) for q in queries]
+    t2 = time.perf_counter()
+    print(r1 == r2, f"word_break: {t1 - t0:.2f}s, WordSegmenter: {t2 - t1:.2f}s (com build)")
+
+
+# 10. LCS e Edit Distance em memória linear – duas linhas + Hirschberg
+def _lcs_row(a, b) -> list[int]:
+    """Última linha da tabela de LCS de a × b, guardando só duas linhas."""
+    prev = [0]*(len(b)+1)
+    for x in a:
+        cur = [0]
+        for j, y in enumerate(b, 1):
+            cur.append(prev[j-1] + 1 if x == y else max(prev[j], cur[j-1]))
+        prev = cur
+    return prev
+
+def _ed_row(a, b) -> list[int]:
+    """Última linha da tabela de edit distance de a × b, com duas linhas."""
+    prev = list(range(len(b)+1))
+    for i, x in enumerate(a, 1):
+        cur = [i]
+        for j, y in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j-1] + 1, prev[j-1] + (x != y)))
+        prev = cur
+    return prev
+
+def lcs_length(a, b) -> int:
+    """
+    Mesmo resultado de lcs em O(min(m, n)) de memória.
+    Exemplo:
+        >>> lcs_length("AGGTAB", "GXTXAYB")
+        4
+    """
+    if len(b) > len(a):
+        a, b = b, a
+    return _lcs_row(a, b)[-1]
+
+def edit_distance_linear(a, b) -> int:
+    """
+    Mesmo resultado de edit_distance em O(min(m, n)) de memória.
+    Exemplo:
+        >>> edit_distance_linear("kitten", "sitting")
+        3
+    """
+    if len(b) > len(a):
+        a, b = b, a
+    return _ed_row(a, b)[-1]
+
+def hirschberg_lcs(a, b):
+    """
+    Recupera a própria subsequência comum máxima em O(m·n) tempo e O(m+n)
+    memória: divide a ao meio, acha o ponto de corte k de b que maximiza
+    LCS(a1, b[:k]) + LCS(a2, b[k:]) (linha direta + linha reversa) e recursa.
+    Exemplo:
+        >>> hirschberg_lcs("AGGTAB", "GXTXAYB")
+        'GTAB'
+    """
+    res = []
+    def rec(a, b):
+        if not a or not b:
+            return
+        if len(a) == 1:
+            if a[0] in b:
+                res.append(a[0])
+            return
+        mid = len(a) // 2
+        left = _lcs_row(a[:mid], b)
+        right = _lcs_row(a[mid:][::-1], b[::-1])
+        n = len(b)
+        k = max(range(n+1), key=lambda j: left[j] + right[n-j])
+        rec(a[:mid], b[:k])
+        rec(a[mid:], b[k:])
+    rec(a, b)
+    return "".join(res) if isinstance(a, str) else res
+
+def hirschberg_alignment(a, b) -> list[tuple]:
+    """
+    Alinhamento ótimo de edit distance em memória linear.
+    Retorna pares (x, y): x == y casamento, x != y substituição,
+    (x, None) deleção, (None, y) inserção.
+    Exemplo:
+        >>> hirschberg_alignment("ab", "cb")
+        [('a', 'c'), ('b', 'b')]
+    """
+    if not a:
+        return [(None, y) for y in b]
+    if not b:
+        return [(x, None) for x in a]
+    if len(a) == 1:
+        x = a[0]
+        k = b.index(x) if x in b else 0
+        return [(None, y) for y in b[:k]] + [(x, b[k])] + [(None, y) for y in b[k+1:]]
+    mid = len(a) // 2
+    left = _ed_row(a[:mid], b)
+    right = _ed_row(a[mid:][::-1], b[::-1])
+    n = len(b)
+    k = min(range(n+1), key=lambda j: left[j] + right[n-j])
+    return hirschberg_alignment(a[:mid], b[:k]) + hirschberg_alignment(a[mid:], b[k:])
+
+if __name__ == "__main__":
+    print(lcs_length("AGGTAB", "GXTXAYB"), hirschberg_lcs("AGGTAB", "GXTXAYB"))  # 4 GTAB
+    print(edit_distance_linear("kitten", "sitting"))                           # 3
+    print(hirschberg_alignment("kitten", "sitting"))
+    # [('k','s'), ('i','i'), ('t','t'), ('t','t'), ('e','i'), ('n','n'), (None,'g')]
+
+    import random, time, tracemalloc
+    rnd = random.Random(0)
+    a = "".join(rnd.choice("ACGT") for _ in range(400))
+    b = "".join(rnd.choice("ACGT") for _ in range(400))
+    for name, fn in [("lcs", lcs), ("lcs_length", lcs_length), ("hirschberg_lcs", hirschberg_lcs),
+                     ("edit_distance", edit_distance), ("edit_distance_linear", edit_distance_linear),
+                     ("hirschberg_alignment", hirschberg_alignment)]:
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        fn(a, b)
+        dt = time.perf_counter() - t0
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{name}: {dt:.2f}s, pico {peak / 1024:.0f} KiB")
+
+
+# 11. Edit Distance bit-paralelo (Myers/Hyyrö)
+class BitParallelLevenshtein:
+    """
+    Distância de Levenshtein de uma query fixa contra muitos candidatos.
+    Codifica a coluna da DP em bitsets (ints do Python têm largura
+    arbitrária): VP/VN marcam onde a diferença vertical é +1/-1. Cada
+    caractere do candidato custa O(⌈m/w⌉) operações de palavra em vez de m.
+    A tabela peq (char → bits das posições na query) é calculada uma vez.
+    Exemplo:
+        >>> BitParallelLevenshtein("kitten").distance("sitting")
+        3
+    """
+    def __init__(self, query):
+        self.m = len(query)
+        self.mask = (1 << self.m) - 1
+        self.peq = {}
+        for i, ch in enumerate(query):
+            self.peq[ch] = self.peq.get(ch, 0) | (1 << i)
+
+    def distance(self, cand) -> int:
+        m, mask, peq = self.m, self.mask, self.peq
+        if m == 0:
+            return len(cand)
+        high = 1 << (m - 1)
+        vp, vn, score = mask, 0, m
+        for ch in cand:
+            eq = peq.get(ch, 0)
+            xv = eq | vn
+            xh = (((eq & vp) + vp) ^ vp) | eq
+            ph = vn | ~(xh | vp)
+            mh = vp & xh
+            if ph & high:
+                score += 1
+            elif mh & high:
+                score -= 1
+            ph = (ph << 1) | 1  # borda da DP global: +1 por coluna
+            mh <<= 1
+            vp = (mh | ~(xv | ph)) & mask
+            vn = ph & xv & mask
+        return score
+
+    def distances(self, candidates) -> list[int]:
+        """Pontua todos os candidatos reaproveitando a mesma peq."""
+        dist = self.distance
+        return [dist(c) for c in candidates]
+
+if __name__ == "__main__":
+    bp = BitParallelLevenshtein("kitten")
+    print(bp.distances(["sitting", "kitten", "", "mitten"]))  # [3, 0, 6, 1]
+
+    import random, time
+    rnd = random.Random(1)
+    query = "".join(rnd.choice("abcdefghij") for _ in range(20))
+    cands = ["".join(rnd.choice("abcdefghij") for _ in range(rnd.randint(15, 25)))
+             for _ in range(2000)]
+    t0 = time.perf_counter()
+    d1 = [edit_distance(query, c) for c in cands]
+    t1 = time.perf_counter()
+    d2 = BitParallelLevenshtein(query).distances(cands)
+    t2 = time.perf_counter()
+    print(d1 == d2, f"DP: {len(cands) / (t1 - t0):,.0f} pares/s, "
+          f"bit-paralelo: {len(cands) / (t2 - t1):,.0f} pares/s")
+
+
+# 12. Edit Distance com limiar – banda diagonal e saída antecipada
+def within_distance(a, b, k: int) -> int | None:
+    """
+    Retorna edit_distance(a, b) se for <= k, senão None.
+    Só calcula a banda |i - j| <= k (2k+1 células por linha) e para assim
+    que o mínimo da linha passa de k: O(k·min(m, n)) no pior caso.
+    Exemplo:
+        >>> within_distance("kitten", "sitting", 3)
+        3
+        >>> within_distance("kitten", "sitting", 2) is None
+        True
+    """
+    m, n = len(a), len(b)
+    if abs(m - n) > k:
+        return None
+    INF = k + 1
+    width = 2*k + 1
+    # prev[d] guarda a célula (i, j) com d = j - i + k; prev[width] é sentinela
+    prev = [INF]*(width + 1)
+    for j in range(min(n, k) + 1):
+        prev[j + k] = j
+    for i in range(1, m+1):
+        cur = [INF]*(width + 1)
+        x = a[i-1]
+        row_min = INF
+        for d in range(width):
+            j = i + d - k
+            if j < 0:
+                continue
+            if j > n:
+                break
+            if j == 0:
+                v = i
+            else:
+                v = prev[d] + (x != b[j-1])   # substitui ou casa
+                if prev[d+1] + 1 < v:         # deleta
+                    v = prev[d+1] + 1
+                if d and cur[d-1] + 1 < v:    # insere
+                    v = cur[d-1] + 1
+            if v > INF:
+                v = INF
+            cur[d] = v
+            if v < row_min:
+                row_min = v
+        if row_min > k:
+            return None
+        prev = cur
+    dist = prev[n - m + k]
+    return dist if dist <= k else None
+
+if __name__ == "__main__":
+    print(within_distance("kitten", "sitting", 3))  # 3
+    print(within_distance("kitten", "sitting", 2))  # None
+
+    import random, time
+    rnd = random.Random(2)
+    def mutate(s, edits):
+        s = list(s)
+        for _ in range(edits):
+            op, p = rnd.randrange(3), rnd.randrange(len(s))
+            if op == 0:
+                s[p] = rnd.choice("abcdefghij")
+            elif op == 1:
+                del s[p]
+            else:
+                s.insert(p, rnd.choice("abcdefghij"))
+        return "".join(s)
+    base = ["".join(rnd.choice("abcdefghij") for _ in range(200)) for _ in range(100)]
+    near = [(s, mutate(s, 2)) for s in base]
+    far = [(s, rnd.choice(base)) for s in base]
+    for name, pairs in [("quase duplicados", near), ("distantes", far)]:
+        t0 = time.perf_counter()
+        full = [edit_distance(x, y) for x, y in pairs]
+        t1 = time.perf_counter()
+        band = [within_distance(x, y, 3) for x, y in pairs]
+        t2 = time.perf_counter()
+        ok = all((f if f <= 3 else None) == b for f, b in zip(full, band))
+        print(f"{name}: {ok} edit_distance {t1 - t0:.2f}s, within_distance {t2 - t1:.3f}s")
+
+
+# 13. Diff de linhas – Myers O((N+M)·D) com middle snake em espaço linear
+def _middle_snake(a, alo, ahi, b, blo, bhi):
+    """
+    Busca simultânea para frente e para trás nas diagonais k = x - y até os
+    caminhos de D edições se sobreporem. Retorna (x0, y0, x1, y1, D): a
+    "snake" (trecho diagonal) do meio de um script ótimo, relativa a (alo, blo).
+    """
+    N, M = ahi - alo, bhi - blo
+    delta = N - M
+    odd = delta & 1
+    maxd = (N + M + 1) // 2
+    size = 2*maxd + 3  # índices negativos de k caem no fim da lista sem colidir
+    vf = [0]*size
+    vb = [0]*size
+    for D in range(maxd + 1):
+        for k in range(-D, D+1, 2):
+            x = vf[k+1] if k == -D or (k != D and vf[k-1] < vf[k+1]) else vf[k-1] + 1
+            y = x - k
+            x0, y0 = x, y
+            while x < N and y < M and a[alo+x] == b[blo+y]:
+                x += 1; y += 1
+            vf[k] = x
+            if odd and delta - (D-1) <= k <= delta + (D-1) and x + vb[delta-k] >= N:
+                return x0, y0, x, y, 2*D - 1
+        for k in range(-D, D+1, 2):
+            x = vb[k+1] if k == -D or (k != D and vb[k-1] < vb[k+1]) else vb[k-1] + 1
+            y = x - k
+            x0, y0 = x, y
+            while x < N and y < M and a[ahi-1-x] == b[bhi-1-y]:
+                x += 1; y += 1
+            vb[k] = x
+            if not odd and -D <= delta - k <= D and x + vf[delta-k] >= N:
+                return N - x, M - y, N - x0, M - y0, 2*D
+    raise AssertionError("inalcançável")
+
+def myers_matching_blocks(a, b) -> list[tuple[int, int, int]]:
+    """
+    Blocos (i, j, tamanho) com a[i:i+tamanho] == b[j:j+tamanho] de um script
+    de edição mínimo. Itens precisam ser hasháveis; linhas viram ints
+    (internadas) para a comparação ser barata.
+    """
+    ids = {}
+    a = [ids.setdefault(x, len(ids)) for x in a]
+    b = [ids.setdefault(x, len(ids)) for x in b]
+    blocks = []
+
+    def rec(alo, ahi, blo, bhi):
+        # prefixo e sufixo comuns saem direto
+        p = 0
+        while alo + p < ahi and blo + p < bhi and a[alo+p] == b[blo+p]:
+            p += 1
+        if p:
+            blocks.append((alo, blo, p))
+            alo += p; blo += p
+        s = 0
+        while alo < ahi - s and blo < bhi - s and a[ahi-1-s] == b[bhi-1-s]:
+            s += 1
+        ahi -= s; bhi -= s
+        if alo < ahi and blo < bhi:
+            x0, y0, x1, y1, D = _middle_snake(a, alo, ahi, b, blo, bhi)
+            if D > 1:
+                rec(alo, alo + x0, blo, blo + y0)
+                if x1 > x0:
+                    blocks.append((alo + x0, blo + y0, x1 - x0))
+                rec(alo + x1, ahi, blo + y1, bhi)
+        if s:
+            blocks.append((ahi, bhi, s))
+
+    rec(0, len(a), 0, len(b))
+    # junta blocos adjacentes
+    merged = []
+    for i, j, n in blocks:
+        if merged and merged[-1][0] + merged[-1][2] == i and merged[-1][1] + merged[-1][2] == j:
+            pi, pj, pn = merged.pop()
+            merged.append((pi, pj, pn + n))
+        else:
+            merged.append((i, j, n))
+    return merged
+
+def myers_opcodes(a, b) -> list[tuple[str, int, int, int, int]]:
+    """Opcodes no formato de difflib: (tag, i1, i2, j1, j2)."""
+    ops = []
+    i = j = 0
+    for bi, bj, n in myers_matching_blocks(a, b) + [(len(a), len(b), 0)]:
+        if i < bi and j < bj:
+            ops.append(("replace", i, bi, j, bj))
+        elif i < bi:
+            ops.append(("delete", i, bi, j, bj))
+        elif j < bj:
+            ops.append(("insert", i, bi, j, bj))
+        if n:
+            ops.append(("equal", bi, bi + n, bj, bj + n))
+        i, j = bi + n, bj + n
+    return ops
+
+def myers_hunks(a, b, n: int = 3):
+    """
+    Gera hunks (listas de opcodes) com até n linhas de contexto,
+    agrupando mudanças separadas por menos de 2n linhas iguais.
+    """
+    ops = myers_opcodes(a, b)
+    if not ops:
+        return
+    if ops[0][0] == "equal":
+        t, i1, i2, j1, j2 = ops[0]
+        ops[0] = (t, max(i1, i2 - n), i2, max(j1, j2 - n), j2)
+    if ops[-1][0] == "equal":
+        t, i1, i2, j1, j2 = ops[-1]
+        ops[-1] = (t, i1, min(i2, i1 + n), j1, min(j2, j1 + n))
+    group = []
+    for t, i1, i2, j1, j2 in ops:
+        if t == "equal" and i2 - i1 > 2*n:
+            group.append((t, i1, i1 + n, j1, j1 + n))
+            yield group
+            group = []
+            i1, j1 = i2 - n, j2 - n
+        group.append((t, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        yield group
+
+def myers_unified_diff(a, b, fromfile: str = "", tofile: str = "", n: int = 3):
+    """Fluxo de linhas no formato unified diff (como difflib.unified_diff)."""
+    started = False
+    for group in myers_hunks(a, b, n):
+        if not started:
+            yield f"--- {fromfile}\n"
+            yield f"+++ {tofile}\n"
+            started = True
+        i1, i2, j1, j2 = group[0][1], group[-1][2], group[0][3], group[-1][4]
+        src = f"{i1 + 1},{i2 - i1}" if i2 - i1 != 1 else f"{i1 + 1}"
+        dst = f"{j1 + 1},{j2 - j1}" if j2 - j1 != 1 else f"{j1 + 1}"
+        if i2 == i1:
+            src = f"{i1},0"
+        if j2 == j1:
+            dst = f"{j1},0"
+        yield f"@@ -{src} +{dst} @@\n"
+        for t, g1, g2, h1, h2 in group:
+            if t == "equal":
+                for line in a[g1:g2]:
+                    yield " " + line
+                continue
+            for line in a[g1:g2]:
+                yield "-" + line
+            for line in b[h1:h2]:
+                yield "+" + line
+
+if __name__ == "__main__":
+    old = ["a\n", "b\n", "c\n", "a\n", "b\n", "b\n", "a\n"]
+    new = ["c\n", "b\n", "a\n", "b\n", "a\n", "c\n"]
+    print("".join(myers_unified_diff(old, new, "old", "new")), end="")
+
+    import difflib, random, time
+    rnd = random.Random(3)
+    config = [f"key_{i} = {rnd.randint(0, 10**6)}\n" for i in range(20_000)]
+    changed = config[:]
+    for _ in range(50):
+        p = rnd.randrange(len(changed))
+        op = rnd.randrange(3)
+        if op == 0:
+            changed[p] = f"key_{p} = changed\n"
+        elif op == 1:
+            del changed[p]
+        else:
+            changed.insert(p, f"new_key_{p} = 1\n")
+    t0 = time.perf_counter()
+    ours = list(myers_unified_diff(config, changed))
+    t1 = time.perf_counter()
+    theirs = list(difflib.unified_diff(config, changed))
+    t2 = time.perf_counter()
+    print(f"myers: {t1 - t0:.2f}s ({len(ours)} linhas), difflib: {t2 - t1:.2f}s ({len(theirs)} linhas)")
+
+
+# 14. LCS esparsa (Hunt–Szymanski) e escolha automática
+from bisect import bisect_left
+from collections import Counter
+
+def lcs_hunt_szymanski(a, b) -> int:
+    """
+    LCS via pares casados: para cada a[i], as posições j de b com o mesmo
+    símbolo, em ordem decrescente, formam uma sequência cuja maior
+    subsequência estritamente crescente é a LCS. Com r pares casados custa
+    O((r + n) log n) – ótimo quando casamentos são raros (alfabeto grande).
+    Exemplo:
+        >>> lcs_hunt_szymanski("AGGTAB", "GXTXAYB")
+        4
+    """
+    where = {}
+    for j in range(len(b) - 1, -1, -1):
+        where.setdefault(b[j], []).append(j)  # já em ordem decrescente
+    tails = []  # tails[k] = menor j que termina uma subsequência de tamanho k+1
+    for x in a:
+        for j in where.get(x, ()):
+            k = bisect_left(tails, j)
+            if k == len(tails):
+                tails.append(j)
+            else:
+                tails[k] = j
+    return len(tails)
+
+def lcs_auto(a, b) -> int:
+    """
+    Escolhe o algoritmo pela contagem de pares casados r (calculada em
+    O(m+n) com Counter): Hunt–Szymanski se r·log2(n) < m·n, senão a DP
+    densa de duas linhas.
+    """
+    m, n = len(a), len(b)
+    if not m or not n:
+        return 0
+    ca, cb = Counter(a), Counter(b)
+    r = sum(c * cb[s] for s, c in ca.items() if s in cb)
+    if r * max(1, n.bit_length()) < m * n:
+        return lcs_hunt_szymanski(a, b)
+    return lcs_length(a, b)
+
+if __name__ == "__main__":
+    print(lcs_hunt_szymanski("AGGTAB", "GXTXAYB"), lcs_auto("AGGTAB", "GXTXAYB"))  # 4 4
+
+    import random, time
+    rnd = random.Random(4)
+    tokens_a = [rnd.randrange(50_000) for _ in range(3000)]  # IDs de tokens: poucos casamentos
+    tokens_b = [rnd.randrange(50_000) for _ in range(3000)]
+    for name, fn in [("lcs", lcs), ("lcs_hunt_szymanski", lcs_hunt_szymanski), ("lcs_auto", lcs_auto)]:
+        t0 = time.perf_counter()
+        res = fn(tokens_a, tokens_b)
+        print(f"{name}: {res} em {time.perf_counter() - t0:.3f}s")
+
+
+# 15. Knapsack 0/1 vetorizado com NumPy (+ reconstrução dos itens)
+try:
+    import numpy as np
+except ImportError:  # as versões NumPy são opcionais
+    np = None
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("esta versão do knapsack requer NumPy (pip install numpy)")
+
+def knapsack_01_np(values: list[int], weights: list[int], W: int,
+                   reconstruct: bool = False):
+    """
+    Mesmo resultado de knapsack_01 com uma só linha dp[0..W]: cada item é
+    um único np.maximum(dp[w:], dp[:-w] + v). Com reconstruct=True guarda,
+    por item, um bitset (np.packbits) de "o item melhorou esta capacidade"
+    – n·W/8 bytes – e devolve (valor, índices escolhidos).
+    Exemplo:
+        >>> knapsack_01_np([60,100,120], [10,20,30], 50, reconstruct=True)
+        (220, [1, 2])
+    """
+    _require_numpy()
+    dp = np.zeros(W + 1, dtype=np.int64)
+    keep = []
+    for v, w in zip(values, weights):
+        if w > W:
+            keep.append(None)
+            continue
+        if w == 0:
+            keep.append(v > 0)
+            if v > 0:
+                dp += v
+            continue
+        cand = dp[:-w] + v
+        better = cand > dp[w:]
+        if reconstruct:
+            keep.append(np.packbits(better))
+        np.maximum(dp[w:], cand, out=dp[w:])
+    best = int(dp[W])
+    if not reconstruct:
+        return best
+    chosen, cap = [], W
+    for i in range(len(values) - 1, -1, -1):
+        row, w = keep[i], weights[i]
+        if row is None:
+            continue
+        if w == 0:
+            if row:
+                chosen.append(i)
+        elif cap >= w and (row[(cap - w) >> 3] >> (7 - ((cap - w) & 7))) & 1:
+            chosen.append(i)
+            cap -= w
+    return best, chosen[::-1]
+
+def knapsack_01_by_value(values: list[int], weights: list[int], W: int,
+                         reconstruct: bool = False):
+    """
+    DP indexada por valor para W enorme e valor total pequeno:
+    minw[x] = menor peso que atinge valor exatamente x, tamanho sum(values)+1.
+    Exemplo:
+        >>> knapsack_01_by_value([60,100,120], [10,20,30], 10**12)
+        280
+    """
+    _require_numpy()
+    total = sum(values)
+    inf = np.iinfo(np.int64).max // 2
+    minw = np.full(total + 1, inf, dtype=np.int64)
+    minw[0] = 0
+    keep = []
+    for v, w in zip(values, weights):
+        if v == 0:
+            keep.append(None)
+            continue
+        cand = minw[:-v] + w
+        better = cand < minw[v:]
+        if reconstruct:
+            keep.append(np.packbits(better))
+        np.minimum(minw[v:], cand, out=minw[v:])
+    best = int(np.flatnonzero(minw <= W)[-1])
+    if not reconstruct:
+        return best
+    chosen, x = [], best
+    for i in range(len(values) - 1, -1, -1):
+        row, v = keep[i], values[i]
+        if row is None:
+            continue
+        if x >= v and (row[(x - v) >> 3] >> (7 - ((x - v) & 7))) & 1:
+            chosen.append(i)
+            x -= v
+    return best, chosen[::-1]
+
+if __name__ == "__main__" and np is not None:
+    print(knapsack_01_np([60,100,120], [10,20,30], 50, reconstruct=True))       # (220, [1, 2])
+    print(knapsack_01_by_value([60,100,120], [10,20,30], 50, reconstruct=True)) # (220, [1, 2])
+
+    import random, time
+    rnd = random.Random(5)
+    vals = [rnd.randint(1, 1000) for _ in range(200)]
+    wts = [rnd.randint(1, 50_000) for _ in range(200)]
+    W = 1_000_000
+    t0 = time.perf_counter()
+    best, items = knapsack_01_np(vals, wts, W, reconstruct=True)
+    t1 = time.perf_counter()
+    print(best, sum(vals[i] for i in items) == best, sum(wts[i] for i in items) <= W,
+          f"{t1 - t0:.2f}s para n=200, W=10^6")
+    t0 = time.perf_counter()
+    print(knapsack_01(vals[:40], wts[:40], 20_000) == knapsack_01_np(vals[:40], wts[:40], 20_000),
+          f"knapsack_01 (n=40, W=2·10^4) {time.perf_counter() - t0:.2f}s")
+
+
+# 16. Hungarian (Kuhn–Munkres, potenciais de Jonker–Volgenant) – O(n³)
+def hungarian(cost: list[list[float]], use_numpy: bool | None = None):
+    """
+    Atribuição de custo mínimo numa matriz n×m qualquer (retangular ok):
+    cada linha recebe uma coluna distinta (ou o contrário, se n > m).
+    Retorna (custo, assignment) com assignment[i] = coluna da linha i
+    (None para linhas que sobram quando n > m).
+    Substitui a DP de bitmask (assignment_min_cost) para n grande; ela
+    continua útil para conferir resultados em n pequeno.
+    Exemplo:
+        >>> hungarian([[9,2,7,8],[6,4,3,7],[5,8,1,8],[7,6,9,4]])
+        (13, [1, 0, 2, 3])
+    """
+    n = len(cost)
+    m = len(cost[0]) if n else 0
+    if n == 0 or m == 0:
+        return 0, [None] * n
+    if n > m:
+        # resolve a transposta e inverte a atribuição
+        total, cols = hungarian([list(col) for col in zip(*cost)], use_numpy)
+        rows = [None] * n
+        for j, i in enumerate(cols):
+            rows[i] = j
+        return total, rows
+    if use_numpy is None:
+        use_numpy = np is not None
+    p = _hungarian_np(cost, n, m) if use_numpy else _hungarian_py(cost, n, m)
+    # p[j] = linha (1-based) atribuída à coluna j
+    assignment = [None] * n
+    for j in range(1, m + 1):
+        if p[j]:
+            assignment[p[j] - 1] = j - 1
+    return sum(cost[i][j] for i, j in enumerate(assignment)), assignment
+
+def _hungarian_py(cost, n, m):
+    INF = float('inf')
+    u = [0] * (n + 1)
+    v = [0] * (m + 1)
+    p = [0] * (m + 1)    # p[j]: linha casada com a coluna j (0 = livre)
+    way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [INF] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0, delta, j1 = p[j0], INF, 0
+            row = cost[i0 - 1]
+            ui0 = u[i0]
+            for j in range(1, m + 1):
+                if not used[j]:
+                    cur = row[j - 1] - ui0 - v[j]
+                    if cur < minv[j]:
+                        minv[j], way[j] = cur, j0
+                    if minv[j] < delta:
+                        delta, j1 = minv[j], j
+            for j in range(m + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        # aumenta pelo caminho alternante
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+    return p
+
+def _hungarian_np(cost, n, m):
+    # mesmo algoritmo, com o laço interno sobre as colunas vetorizado
+    C = np.asarray(cost, dtype=np.float64)
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    p = np.zeros(m + 1, dtype=np.int64)
+    way = np.zeros(m + 1, dtype=np.int64)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = np.full(m + 1, np.inf)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = p[j0]
+            free = ~used
+            free[0] = False
+            cur = C[i0 - 1] - u[i0] - v[1:]
+            upd = free[1:] & (cur < minv[1:])
+            minv[1:][upd] = cur[upd]
+            way[1:][upd] = j0
+            masked = np.where(free, minv, np.inf)
+            j1 = int(masked.argmin())
+            delta = masked[j1]
+            u[p[used]] += delta
+            v[used] -= delta
+            minv[~used] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+    return p.tolist()
+
+if __name__ == "__main__":
+    cost = [
+        [9,2,7,8],
+        [6,4,3,7],
+        [5,8,1,8],
+        [7,6,9,4]
+    ]
+    print(hungarian(cost))                      # (13, [1, 0, 2, 3])
+    print(hungarian([[4, 1, 3], [2, 0, 5]]))    # (3, [1, 0])
+    print(hungarian([[4, 2], [1, 0], [3, 5]]))  # (3, [1, 0, None]) – linha 2 sobra
+
+    import random, time
+    rnd = random.Random(6)
+    small = [[rnd.randint(0, 100) for _ in range(10)] for _ in range(10)]
+    print(hungarian(small)[0] == assignment_min_cost(small))  # True
+    big = [[rnd.randint(0, 10**6) for _ in range(300)] for _ in range(300)]
+    t0 = time.perf_counter()
+    c1 = hungarian(big, use_numpy=False)[0]
+    t1 = time.perf_counter()
+    print(f"n=300 puro: {t1 - t0:.2f}s", end="")
+    if np is not None:
+        c2 = hungarian(big, use_numpy=True)[0]
+        print(f", numpy: {time.perf_counter() - t1:.2f}s, mesmo custo: {c1 == c2}")
+    else:
+        print()
+
+
+# 17. DP com Bitmask vetorizada – motor por popcount + Held–Karp (TSP)
+def popcount_layers(n: int) -> list:
+    """layers[k] = array NumPy com todas as máscaras de n bits com k bits ligados."""
+    _require_numpy()
+    masks = np.arange(1 << n, dtype=np.int64)
+    pc = np.zeros(1 << n, dtype=np.int8)
+    for b in range(n):
+        pc += (masks >> b) & 1
+    order = np.argsort(pc, kind="stable")
+    bounds = np.cumsum(np.bincount(pc, minlength=n + 1))
+    return np.split(masks[order], bounds[:-1])
+
+class SubsetDP:
+    """
+    Motor genérico de DP sobre subconjuntos: tabela (2^n, width) e uma
+    função step(dp, masks, k) chamada uma vez por camada de popcount k.
+    Como toda transição vai de |S|-1 para |S|, a camada inteira é um único
+    passo vetorizado em vez de um laço Python por máscara.
+    """
+    def __init__(self, n: int, width: int = 1, fill=float('inf'), dtype=None):
+        _require_numpy()
+        self.n = n
+        self.dp = np.full((1 << n, width), fill, dtype=dtype or np.float64)
+        self.layers = popcount_layers(n)
+
+    def run(self, step, start: int = 1):
+        for k in range(start, self.n + 1):
+            step(self.dp, self.layers[k], k)
+        return self.dp
+
+def assignment_min_cost_np(cost: list[list[int]]) -> int:
+    """assignment_min_cost sobre o SubsetDP (width=1): mesma DP, por camadas."""
+    n = len(cost)
+    C = np.asarray(cost, dtype=np.float64)
+    eng = SubsetDP(n)
+    eng.dp[0, 0] = 0
+    def step(dp, masks, k):
+        # a pessoa k-1 escolhe a tarefa j ∈ máscara
+        best = np.full(len(masks), np.inf)
+        for j in range(n):
+            has = ((masks >> j) & 1).astype(bool)
+            cand = dp[masks ^ (1 << j), 0] + C[k - 1, j]
+            best = np.where(has, np.minimum(best, cand), best)
+        dp[masks, 0] = best
+    eng.run(step)
+    return int(eng.dp[-1, 0])
+
+def held_karp(dist: list[list[float]]):
+    """
+    TSP exato saindo e voltando ao nó 0, O(2^n·n²) com NumPy.
+    Fixa o nó 0 como origem, então a tabela é 2^(n-1) × (n-1):
+    dp[S, j] = menor custo de 0 → visitar S → terminar em j.
+    parent (int8) guarda o penúltimo nó para recuperar a rota.
+    Retorna (custo, rota) com rota = [0, ..., 0].
+    Exemplo:
+        >>> held_karp([[0,10,15,20],[10,0,35,25],[15,35,0,30],[20,25,30,0]])
+        (80.0, [0, 2, 3, 1, 0])
+    """
+    n = len(dist)
+    if n == 1:
+        return 0.0, [0, 0]
+    D = np.asarray(dist, dtype=np.float64)
+    m = n - 1
+    sub = D[1:, 1:]
+    eng = SubsetDP(m, width=m)
+    parent = np.full((1 << m, m), -1, dtype=np.int8)
+    for j in range(m):
+        eng.dp[1 << j, j] = D[0, j + 1]
+    def step(dp, masks, k):
+        for j in range(m):
+            sel = masks[((masks >> j) & 1).astype(bool)]
+            prev = sel ^ (1 << j)
+            cand = dp[prev] + sub[:, j]  # (len(sel), m): vindo de cada i
+            i = cand.argmin(axis=1)
+            dp[sel, j] = cand[np.arange(len(sel)), i]
+            parent[sel, j] = i
+    dp = eng.run(step, start=2)
+    full = (1 << m) - 1
+    last = int((dp[full] + D[1:, 0]).argmin())
+    total = float(dp[full, last] + D[last + 1, 0])
+    route, mask, j = [], full, last
+    while j >= 0:
+        route.append(j + 1)
+        mask, j = mask ^ (1 << j), int(parent[mask, j])
+    return total, [0] + route[::-1] + [0]
+
+if __name__ == "__main__" and np is not None:
+    print(held_karp([[0,10,15,20],[10,0,35,25],[15,35,0,30],[20,25,30,0]]))  # (80.0, [0, 2, 3, 1, 0])
+    print(assignment_min_cost_np([[9,2,7,8],[6,4,3,7],[5,8,1,8],[7,6,9,4]]))   # 13
+
+    import random, time
+    rnd = random.Random(7)
+    for n in range(12, 21, 2):
+        pts = [(rnd.random(), rnd.random()) for _ in range(n)]
+        dist = [[((a[0]-b[0])**2 + (a[1]-b[1])**2) ** 0.5 for b in pts] for a in pts]
+        t0 = time.perf_counter()
+        held_karp(dist)
+        dt = time.perf_counter() - t0
+        mib = (1 << (n - 1)) * (n - 1) * (8 + 1) / 2**20  # dp float64 + parent int8
+        print(f"n={n}: {dt:.2f}s, tabelas {mib:.1f} MiB")
+    print(f"n=22: tabelas {(1 << 21) * 21 * 9 / 2**20:.0f} MiB (estimado)")
+
+
+# 18. Fibonacci por fast doubling e recorrências lineares (Kitamasa)
+def fib_fast(n: int, mod: int | None = None) -> int:
+    """
+    F(n) em O(log n) sem recursão (fib estoura a pilha perto de n≈1000):
+    F(2k) = F(k)·(2F(k+1) - F(k)),  F(2k+1) = F(k)² + F(k+1)².
+    Exemplo:
+        >>> fib_fast(10), fib_fast(10**18, 10**9 + 7)
+        (55, 209783453)
+    """
+    if n < 0:
+        raise ValueError("n deve ser >= 0")
+    a, b = 0, 1  # F(k), F(k+1) para k = prefixo dos bits de n já lidos
+    for bit in bin(n)[2:]:
+        c = a * (2*b - a)
+        d = a*a + b*b
+        if mod:
+            c %= mod
+            d %= mod
+        if bit == "1":
+            a, b = d, (c + d) % mod if mod else c + d
+        else:
+            a, b = c, d
+    return a
+
+def _polymulmod(p, q, coeffs, mod):
+    """p·q mod (x^k - c1·x^(k-1) - ... - ck), polinômios como listas (grau < k)."""
+    k = len(coeffs)
+    prod = [0] * (2*k - 1)
+    for i, x in enumerate(p):
+        if x:
+            for j, y in enumerate(q):
+                prod[i + j] += x * y
+    # reduz de cima para baixo usando x^k = Σ c_i·x^(k-i)
+    for d in range(2*k - 2, k - 1, -1):
+        t = prod[d]
+        if t:
+            for i, c in enumerate(coeffs, 1):
+                prod[d - i] += t * c
+    res = prod[:k]
+    return [x % mod for x in res] if mod else res
+
+def linear_recurrence(coeffs: list[int], init: list[int], n: int,
+                      mod: int | None = None) -> int:
+    """
+    a(n) para a(n) = c1·a(n-1) + ... + ck·a(n-k), dados a(0..k-1) = init.
+    Kitamasa: calcula x^n mod o polinômio característico em O(k² log n)
+    e combina com os valores iniciais.
+    Exemplo:
+        >>> linear_recurrence([1, 1], [0, 1], 10)
+        55
+    """
+    return linear_recurrence_many(coeffs, init, [n], mod)[0]
+
+def linear_recurrence_many(coeffs: list[int], init: list[int], ns,
+                           mod: int | None = None) -> list[int]:
+    """
+    Avalia a recorrência em vários n. Se os n são pequenos e densos, gera
+    a sequência uma vez em O(max(n)·k); senão reaproveita as potências
+    x^(2^j) mod P, calculadas uma só vez para todas as consultas.
+    """
+    ns = list(ns)
+    k = len(coeffs)
+    if not ns:
+        return []
+    if min(ns) < 0:
+        raise ValueError("todos os n devem ser >= 0")
+    top = max(ns)
+    if k == 0:
+        return [0] * len(ns)
+    if top < k or top <= len(ns) * k * max(1, top.bit_length()):
+        seq = [x % mod for x in init] if mod else list(init)
+        while len(seq) <= top:
+            v = sum(c * seq[-i] for i, c in enumerate(coeffs, 1))
+            seq.append(v % mod if mod else v)
+        return [seq[n] for n in ns]
+    # x^1 mod P (x^1 = x, exceto para k = 1, onde x ≡ c1)
+    x = [0, 1] + [0] * (k - 2) if k > 1 else [coeffs[0] % mod if mod else coeffs[0]]
+    pows = [x]
+    for _ in range(top.bit_length() - 1):
+        pows.append(_polymulmod(pows[-1], pows[-1], coeffs, mod))
+    res = []
+    for n in ns:
+        r = [1] + [0] * (k - 1)  # x^0
+        j = 0
+        while n:
+            if n & 1:
+                r = _polymulmod(r, pows[j], coeffs, mod)
+            n >>= 1
+            j += 1
+        v = sum(a * b for a, b in zip(r, init))
+        res.append(v % mod if mod else v)
+    return res
+
+if __name__ == "__main__":
+    print(fib_fast(10), fib_fast(5000) == linear_recurrence([1, 1], [0, 1], 5000))  # 55 True
+    print(fib_fast(10**18, 10**9 + 7))                                            # 209783453
+    # tribonacci mod p em vários n de uma vez
+    print(linear_recurrence_many([1, 1, 1], [0, 0, 1], [10, 10**12, 10**15], 998244353))
+    print(linear_recurrence_many([1, 1, 1], [0, 0, 1], range(10)))  # [0, 0, 1, 1, 2, 4, 7, 13, 24, 44]
+
+
+# 19. Palíndromos em memória O(n) – Manacher + DP de cortes por centros
+def palindrome_radii(s: str) -> tuple[list[int], list[int]]:
+    """
+    Manacher em O(n): d1[i] = nº de palíndromos ímpares centrados em i
+    (o maior tem tamanho 2·d1[i]-1); d2[i] = nº de palíndromos pares
+    centrados entre i-1 e i (o maior tem tamanho 2·d2[i]).
+    Exemplo:
+        >>> palindrome_radii("abaa")
+        ([1, 2, 1, 1], [0, 0, 0, 1])
+    """
+    n = len(s)
+    d1 = [0]*n
+    l, r = 0, -1
+    for i in range(n):
+        k = 1 if i > r else min(d1[l + r - i], r - i + 1)
+        while i - k >= 0 and i + k < n and s[i-k] == s[i+k]:
+            k += 1
+        d1[i] = k
+        if i + k - 1 > r:
+            l, r = i - k + 1, i + k - 1
+    d2 = [0]*n
+    l, r = 0, -1
+    for i in range(n):
+        k = 0 if i > r else min(d2[l + r - i + 1], r - i + 1)
+        while i - k - 1 >= 0 and i + k < n and s[i-k-1] == s[i+k]:
+            k += 1
+        d2[i] = k
+        if i + k - 1 > r:
+            l, r = i - k, i + k - 1
+    return d1, d2
+
+def palindrome_profile(s: str) -> tuple[int, str, list[int], list[int]]:
+    """
+    Numa mesma passada: (min cortes, maior substring palíndroma, d1, d2).
+    Substitui a matriz n×n is_pal de min_cut_palindrome: percorre os
+    centros em ordem crescente e relaxa dp[fim+1] a partir de dp[início]
+    para cada palíndromo dado pelos raios. Memória O(n); tempo
+    O(n + nº de palíndromos) (O(n²) só em entradas como "aaaa...").
+    """
+    n = len(s)
+    d1, d2 = palindrome_radii(s)
+    dp = list(range(-1, n))  # dp[i] = min cortes para s[:i]; dp[0] = -1
+    for i in range(n):
+        # pares centrados entre i-1 e i: s[i-r : i+r]
+        for r in range(1, d2[i] + 1):
+            if dp[i-r] + 1 < dp[i+r]:
+                dp[i+r] = dp[i-r] + 1
+        # ímpares centrados em i: s[i-r : i+r+1]
+        for r in range(d1[i]):
+            if dp[i-r] + 1 < dp[i+r+1]:
+                dp[i+r+1] = dp[i-r] + 1
+    return (dp[n] if n else 0), _longest_from_radii(s, d1, d2), d1, d2
+
+def _longest_from_radii(s: str, d1: list[int], d2: list[int]) -> str:
+    """Maior substring palíndroma a partir dos raios de Manacher, em O(n)."""
+    best_l, best_len = 0, 0
+    for i in range(len(s)):
+        if 2*d1[i] - 1 > best_len:
+            best_l, best_len = i - d1[i] + 1, 2*d1[i] - 1
+        if 2*d2[i] > best_len:
+            best_l, best_len = i - d2[i], 2*d2[i]
+    return s[best_l:best_l + best_len]
+
+def min_cut_palindrome_linear(s: str) -> int:
+    """
+    Mesmo resultado de min_cut_palindrome, sem a matriz n×n.
+    Exemplo:
+        >>> min_cut_palindrome_linear("aab")
+        1
+    """
+    return palindrome_profile(s)[0]
+
+def longest_palindromic_substring(s: str) -> str:
+    """
+    O(n) só com os raios de Manacher (não roda a DP de cortes).
+    Exemplo:
+        >>> longest_palindromic_substring("forgeeksskeegfor")
+        'geeksskeeg'
+    """
+    d1, d2 = palindrome_radii(s)
+    return _longest_from_radii(s, d1, d2)
+
+if __name__ == "__main__":
+    print(min_cut_palindrome_linear("aab"), min_cut_palindrome_linear("a"),
+          min_cut_palindrome_linear("ab"))                      # 1 0 1
+    print(longest_palindromic_substring("forgeeksskeegfor"))    # geeksskeeg
+
+    import random, time, tracemalloc
+    rnd = random.Random(8)
+    for n in (1_000, 10_000, 100_000):
+        s = "".join(rnd.choice("abc") for _ in range(n))
+        runs = [("linear", min_cut_palindrome_linear)]
+        if n <= 1_000:
+            runs.insert(0, ("matriz n×n", min_cut_palindrome))
+        for name, fn in runs:
+            tracemalloc.start()
+            t0 = time.perf_counter()
+            cuts = fn(s)
+            dt = time.perf_counter() - t0
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"n={n} {name}: {cuts} cortes, {dt:.2f}s, pico {peak / 2**20:.1f} MiB")
+
+
+# 20. Caminho mínimo em grade por streaming de linhas (+ bitmap de direções)
+def _min_path_row_np(prev, row):
+    """
+    Linha i da DP de uma vez: dp[j] = min_{k<=j}(prev[k] + g[k..j])
+    = P[j] + min.accumulate(prev[k] - P[k-1]), com P = cumsum(g).
+    left[j] diz se o melhor caminho chega pela esquerda (empate → de cima).
+    """
+    P = np.cumsum(row)
+    A = prev - (P - row)
+    M = np.minimum.accumulate(A)
+    left = np.zeros(len(row), dtype=bool)
+    left[1:] = M[:-1] < A[1:]
+    return P + M, left
+
+def min_path_sum_stream(rows, record_path: bool = False, bitmap_file: str | None = None):
+    """
+    min_path_sum lendo a grade linha a linha (iterador de listas, arquivo,
+    ou um np.memmap – iterar um memmap 2-D devolve linhas sem copiar a
+    grade) e guardando só uma linha da DP.
+    Com record_path=True grava 1 bit por célula (1 = veio da esquerda),
+    empacotado por linha – em memória ou em bitmap_file, para grades que
+    nem o bitmap cabe na RAM – e devolve (custo, caminho [(i, j), ...]).
+    Exemplo:
+        >>> min_path_sum_stream(iter([[1,3,1],[1,5,1],[4,2,1]]), record_path=True)
+        (7, [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2)])
+    """
+    prev = None
+    bitmaps = [] if record_path and bitmap_file is None else None
+    out = open(bitmap_file, "w+b") if record_path and bitmap_file else None
+    m = n = 0
+    try:
+        for row in rows:
+            if np is not None:
+                row = np.asarray(row)
+                if row.dtype.kind in "biu":
+                    row = row.astype(np.int64)
+                if prev is None:
+                    # primeira linha: só dá para vir da esquerda
+                    prev = np.cumsum(row)
+                    left = np.ones(len(row), dtype=bool)
+                    left[0] = False
+                else:
+                    prev, left = _min_path_row_np(prev, row)
+                packed = np.packbits(left).tobytes() if record_path else None
+            else:
+                if prev is None:
+                    cur = [row[0]]
+                    for x in row[1:]:
+                        cur.append(cur[-1] + x)
+                    left = [False] + [True] * (len(row) - 1)
+                else:
+                    cur = [prev[0] + row[0]]
+                    left = [False]
+                    for j in range(1, len(row)):
+                        from_left = cur[j-1] < prev[j]
+                        cur.append((cur[j-1] if from_left else prev[j]) + row[j])
+                        left.append(from_left)
+                prev = cur
+                if record_path:
+                    packed = bytearray((len(left) + 7) // 8)
+                    for j, b in enumerate(left):
+                        if b:
+                            packed[j >> 3] |= 0x80 >> (j & 7)
+            if record_path:
+                if out:
+                    out.write(packed)
+                else:
+                    bitmaps.append(packed)
+            m, n = m + 1, len(row)
+        if prev is None:
+            raise ValueError("grade vazia")
+        total = prev[-1].item() if np is not None else prev[-1]
+        if not record_path:
+            return total
+        # volta do canto inferior direito seguindo os bits
+        row_bytes = (n + 7) // 8
+        i, j = m - 1, n - 1
+        path = [(i, j)]
+        bits = None
+        cur_row = -1
+        while i or j:
+            if cur_row != i:
+                if out:
+                    out.seek(i * row_bytes)
+                    bits = out.read(row_bytes)
+                else:
+                    bits = bitmaps[i]
+                cur_row = i
+            if (bits[j >> 3] >> (7 - (j & 7))) & 1:
+                j -= 1
+            else:
+                i -= 1
+            path.append((i, j))
+        return total, path[::-1]
+    finally:
+        if out:
+            out.close()
+
+if __name__ == "__main__":
+    print(min_path_sum_stream(iter([[1,3,1],[1,5,1],[4,2,1]]), record_path=True))
+    # (7, [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2)])
+
+    if np is not None:
+        import os, tempfile, time
+        with tempfile.TemporaryDirectory() as tmp:
+            grid_path = os.path.join(tmp, "custos.bin")
+            size = 2_000
+            grid = np.lib.format.open_memmap(grid_path, mode="w+", dtype=np.int32, shape=(size, size))
+            rng = np.random.default_rng(9)
+            for i in range(size):  # gera sem ter a grade inteira em memória
+                grid[i] = rng.integers(1, 100, size)
+            grid.flush()
+            del grid
+            mm = np.load(grid_path, mmap_mode="r")
+            t0 = time.perf_counter()
+            cost, path = min_path_sum_stream(mm, record_path=True,
+                                             bitmap_file=os.path.join(tmp, "dirs.bin"))
+            print(f"{size}x{size} via memmap: custo {cost}, {len(path)} passos, "
+                  f"{time.perf_counter() - t0:.2f}s", cost == sum(int(mm[i, j]) for i, j in path))
+            del mm  # solta o mapeamento antes de apagar o diretório
@@ -81,6 +81,320 @@ if __name__ == "__main__":
     # saída: [3]
 
 
+# # Hash de prefixos (igualdade de substrings em O(1))
+import random
+
+class PrefixHash:
+    """
+    Tabela de hashes de prefixo + potências da base, módulo o primo de
+    Mersenne 2^61 - 1. Pré-processa o texto em O(n) e depois compara
+    quaisquer duas substrings em O(1), sem refazer o rolling hash.
+    Base aleatória para dificultar colisões provocadas.
+    """
+    MOD = (1 << 61) - 1
+
+    def __init__(self, s: str, base: int | None = None):
+        self.s = s
+        self.n = n = len(s)
+        mod = self.MOD
+        self.base = base if base is not None else random.randrange(256, mod - 1)
+        # h[i] = hash de s[:i]; pw[i] = base^i
+        h = [0] * (n + 1)
+        pw = [1] * (n + 1)
+        b = self.base
+        for i, ch in enumerate(s):
+            h[i + 1] = (h[i] * b + ord(ch)) % mod
+            pw[i + 1] = (pw[i] * b) % mod
+        self.h, self.pw = h, pw
+
+    def get(self, i: int, length: int) -> int:
+        """Hash de s[i:i+length] em O(1)."""
+        return (self.h[i + length] - self.h[i] * self.pw[length]) % self.MOD
+
+    def substring_equal(self, i: int, j: int, length: int) -> bool:
+        """True se s[i:i+length] == s[j:j+length] (probabilístico, colisão ~ n/2^61)."""
+        if i + length > self.n or j + length > self.n:
+            return False
+        return i == j or self.get(i, length) == self.get(j, length)
+
+    def lcp(self, i: int, j: int) -> int:
+        """Maior prefixo comum entre os sufixos s[i:] e s[j:], por busca binária em O(log n)."""
+        if i == j:
+            return self.n - i
+        lo, hi = 0, self.n - max(i, j)
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if self.get(i, mid) == self.get(j, mid):
+                lo = mid
+            else:
+                hi = mid - 1
+        return lo
+
+    def batch_equal(self, queries) -> list[bool]:
+        """
+        queries: iterável de (i, j, length).
+        Retorna uma lista de bools; evita o custo de chamada de método por query.
+        """
+        h, pw, mod, n = self.h, self.pw, self.MOD, self.n
+        res = []
+        for i, j, length in queries:
+            if i + length > n or j + length > n:
+                res.append(False)
+            else:
+                res.append((h[i + length] - h[i] * pw[length]) % mod
+                           == (h[j + length] - h[j] * pw[length]) % mod)
+        return res
+
+    def batch_lcp(self, pairs) -> list[int]:
+        """pairs: iterável de (i, j). Retorna o LCP de cada par."""
+        lcp = self.lcp
+        return [lcp(i, j) for i, j in pairs]
+
+if __name__ == "__main__":
+    ph = PrefixHash("abracadabra")
+    print(ph.substring_equal(0, 7, 4))            # True  ("abra" == "abra")
+    print(ph.substring_equal(0, 5, 4))            # False ("abra" vs "adab")
+    print(ph.lcp(0, 7))                           # 4
+    print(ph.batch_equal([(0, 7, 4), (1, 8, 3), (0, 3, 2)]))  # [True, True, False]
+    print(ph.batch_lcp([(0, 7), (3, 5), (2, 9)]))  # [4, 1, 2]
+
+
+# # Winnowing (fingerprints de documentos para quase-duplicatas)
+import heapq
+import os
+import shutil
+import struct
+import tempfile
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+def kgram_hashes(text: str, k: int, base: int = 257,
+                 mod: int = (1 << 61) - 1) -> list[int]:
+    """
+    Hash de rolling de todos os k-gramas do texto normalizado
+    (minúsculas, só alfanuméricos), em O(n).
+    """
+    s = "".join(ch for ch in text.lower() if ch.isalnum())
+    n = len(s)
+    if n < k:
+        return []
+    power = pow(base, k - 1, mod)
+    h = 0
+    for ch in s[:k]:
+        h = (h * base + ord(ch)) % mod
+    res = [h]
+    for i in range(k, n):
+        h = ((h - ord(s[i - k]) * power) * base + ord(s[i])) % mod
+        res.append(h)
+    return res
+
+def winnow(hashes: list[int], w: int) -> list[tuple[int, int]]:
+    """
+    Seleciona fingerprints (hash, posição): em cada janela de w hashes
+    escolhe o menor (o mais à direita em caso de empate), registrando
+    só quando a escolha muda. Deque monotônica → O(n).
+    """
+    if len(hashes) < w:
+        if not hashes:
+            return []
+        m = min(hashes)
+        return [(m, len(hashes) - 1 - hashes[::-1].index(m))]
+    res = []
+    dq = deque()  # índices com hashes crescentes
+    last = -1
+    for i, h in enumerate(hashes):
+        while dq and hashes[dq[-1]] >= h:
+            dq.pop()
+        dq.append(i)
+        if dq[0] <= i - w:
+            dq.popleft()
+        if i >= w - 1 and dq[0] != last:
+            last = dq[0]
+            res.append((hashes[last], last))
+    return res
+
+def fingerprint_document(args: tuple) -> tuple:
+    """Worker: (doc_id, texto, k, w) → (doc_id, fingerprints)."""
+    doc_id, text, k, w = args
+    return doc_id, winnow(kgram_hashes(text, k), w)
+
+class FingerprintIndex:
+    """
+    Índice invertido fingerprint → documentos. Mantém até max_in_memory
+    entradas em dict; ao passar disso, despeja um run em disco com os
+    registros '<QI' (hash, doc) de 12 bytes ordenados por hash. De cada run
+    fica em memória só um índice esparso (o hash do 1º registro de cada
+    bloco de `block` registros), então query faz busca binária nele e lê
+    apenas os blocos que podem conter os hashes pedidos.
+    Com mais de max_runs runs, todos são intercalados (heapq.merge) num só.
+    Se spill_dir não for dado, cria um diretório temporário que close()
+    (ou o bloco with) remove.
+    """
+    REC = struct.Struct("<QI")
+
+    def __init__(self, spill_dir: str | None = None, max_in_memory: int = 1_000_000,
+                 block: int = 1024, max_runs: int = 16):
+        self._own_dir = spill_dir is None
+        self.spill_dir = spill_dir or tempfile.mkdtemp(prefix="winnow-")
+        self.max_in_memory = max_in_memory
+        self.block = block
+        self.max_runs = max_runs
+        self.mem = defaultdict(list)
+        self.in_memory = 0
+        self.spilled = 0
+        self.runs = []  # (caminho, hashes do 1º registro de cada bloco)
+        self._next_run = 0
+
+    def add(self, doc_id: int, fingerprints: list[tuple[int, int]]) -> None:
+        for h in {h for h, _ in fingerprints}:
+            self.mem[h].append(doc_id)
+            self.in_memory += 1
+        if self.in_memory >= self.max_in_memory:
+            self.spill()
+
+    def _write_run(self, records) -> None:
+        """Grava registros (hash, doc) já ordenados e registra o índice esparso."""
+        path = os.path.join(self.spill_dir, f"run-{self._next_run:06d}.bin")
+        self._next_run += 1
+        keys, pack, block = [], self.REC.pack, self.block
+        with open(path, "wb", buffering=1 << 20) as f:
+            for i, (h, d) in enumerate(records):
+                if i % block == 0:
+                    keys.append(h)
+                f.write(pack(h, d))
+        self.runs.append((path, keys))
+
+    def _read_run(self, path):
+        with open(path, "rb") as f:
+            while data := f.read(self.REC.size * self.block):
+                yield from self.REC.iter_unpack(data)
+
+    def spill(self) -> None:
+        """Despeja o índice em memória como um run ordenado por hash."""
+        if not self.mem:
+            return
+        self._write_run((h, d) for h in sorted(self.mem) for d in self.mem[h])
+        self.spilled += self.in_memory
+        self.mem.clear()
+        self.in_memory = 0
+        if len(self.runs) > self.max_runs:
+            self.compact()
+
+    def compact(self) -> None:
+        """Intercala todos os runs num único run ordenado."""
+        old, self.runs = self.runs, []
+        self._write_run(heapq.merge(*(self._read_run(p) for p, _ in old)))
+        for p, _ in old:
+            os.remove(p)
+
+    def _scan_run(self, path, keys, hashes, hits) -> None:
+        """Para cada hash (ordenado), lê só os blocos do run onde ele pode estar."""
+        size, block = self.REC.size, self.block
+        with open(path, "rb") as f:
+            loaded, buf = -1, []
+            for h in hashes:
+                b = max(0, bisect_left(keys, h) - 1, loaded)
+                while b < len(keys):
+                    if b != loaded:
+                        f.seek(b * block * size)
+                        buf = list(self.REC.iter_unpack(f.read(block * size)))
+                        loaded = b
+                    i = bisect_left(buf, (h, -1))
+                    while i < len(buf) and buf[i][0] == h:
+                        hits[buf[i][1]] += 1
+                        i += 1
+                    if i < len(buf):  # achou um hash maior: fim deste h
+                        break
+                    b += 1
+
+    def query(self, fingerprints: list[tuple[int, int]]) -> Counter:
+        """
+        Retorna Counter doc_id → nº de fingerprints compartilhados.
+        Por run em disco: O(q·log(blocos)) buscas + leitura dos blocos tocados.
+        """
+        hashes = sorted({h for h, _ in fingerprints})
+        hits = Counter()
+        for h in hashes:
+            hits.update(self.mem.get(h, ()))
+        for path, keys in self.runs:
+            self._scan_run(path, keys, hashes, hits)
+        return hits
+
+    def size_bytes(self) -> int:
+        """Tamanho aproximado do índice (disco + entradas em memória)."""
+        disk = sum(os.path.getsize(p) for p, _ in self.runs)
+        return disk + self.in_memory * self.REC.size
+
+    def close(self) -> None:
+        """Remove o diretório de runs se ele foi criado pelo próprio índice."""
+        if self._own_dir and os.path.isdir(self.spill_dir):
+            shutil.rmtree(self.spill_dir)
+        self.mem.clear()
+        self.runs = []
+        self.in_memory = self.spilled = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+def _fingerprint_batch(batch: list[tuple]) -> list[tuple]:
+    """Worker: um lote de (doc_id, texto, k, w) por tarefa."""
+    return [fingerprint_document(args) for args in batch]
+
+def build_fingerprint_index(docs, k: int = 5, w: int = 4, workers: int | None = None,
+                            chunksize: int = 64, max_pending: int | None = None,
+                            **index_kwargs) -> FingerprintIndex:
+    """
+    docs: iterável de (doc_id, texto). Calcula os fingerprints em paralelo
+    (ProcessPoolExecutor) e alimenta o índice no processo principal.
+    Submete lotes de chunksize documentos com no máximo max_pending lotes
+    em voo (padrão 2 por worker): Executor.map leria o corpus inteiro
+    antes do primeiro resultado, anulando o limite de memória do índice.
+    """
+    index = FingerprintIndex(**index_kwargs)
+    if max_pending is None:
+        max_pending = 2 * (workers or os.cpu_count() or 1)
+    jobs = ((doc_id, text, k, w) for doc_id, text in docs)
+    pending = deque()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            while batch := list(islice(jobs, chunksize)):
+                pending.append(pool.submit(_fingerprint_batch, batch))
+                if len(pending) >= max_pending:
+                    for doc_id, fps in pending.popleft().result():
+                        index.add(doc_id, fps)
+            while pending:
+                for doc_id, fps in pending.popleft().result():
+                    index.add(doc_id, fps)
+    except BaseException:
+        index.close()  # não deixa o diretório de runs para trás
+        raise
+    return index
+
+if __name__ == "__main__":
+    print(winnow([77, 74, 42, 17, 98, 50, 17, 98, 8, 88, 67, 39, 77, 74, 42, 17, 98], 4))
+    # [(17, 3), (17, 6), (8, 8), (39, 11), (17, 15)]
+
+    rnd = random.Random(0)
+    vocab = ["lorem", "ipsum", "dolor", "sit", "amet", "consectetur",
+             "adipiscing", "elit", "sed", "tempor", "magna", "aliqua"]
+    docs = [(i, " ".join(rnd.choice(vocab) for _ in range(200))) for i in range(400)]
+    copied = docs[7][1][100:600]  # trecho copiado do documento 7
+    docs.append((400, "texto novo " + copied + " fim"))
+
+    t0 = time.perf_counter()
+    with build_fingerprint_index(docs, k=20, w=8, workers=2, max_in_memory=20_000) as idx:
+        dt = time.perf_counter() - t0
+        print(f"{len(docs) / dt:.0f} docs/s, índice: {idx.size_bytes()} bytes")
+        _, fps = fingerprint_document((400, docs[400][1], 20, 8))
+        print(idx.query(fps).most_common(2))  # [(400, ...), (7, ...)]
+
+
 # # Z-Algorithm
 def z_array(s: str) -> list[int]:
     """
@@ -110,6 +424,7 @@ class AhoNode:
         self.next = {}      # char → AhoNode
         self.fail = None    # fallback
         self.out = []       # padrões que terminam aqui
+        self.depth = 0      # tamanho do prefixo representado pelo nó
 
 class AhoCorasick:
     def __init__(self, patterns: list[str]):
@@ -118,7 +433,11 @@ class AhoCorasick:
         for idx, pat in enumerate(patterns):
             node = self.root
             for ch in pat:
-                node = node.next.setdefault(ch, AhoNode())
+                if ch not in node.next:
+                    child = AhoNode()
+                    child.depth = node.depth + 1
+                    node.next[ch] = child
+                node = node.next[ch]
             node.out.append(idx)
         # build fail links
         queue = []
@@ -144,7 +463,7 @@ class AhoCorasick:
         res = []
         node = self.root
         for i, ch in enumerate(text):
-            while node and ch not in node.next:
+            while node is not self.root and ch not in node.next:
                 node = node.fail
             node = node.next.get(ch, self.root)
             for pat_idx in node.out:
@@ -156,7 +475,136 @@ if __name__ == "__main__":
     ac = AhoCorasick(pats)
     hits = ac.search("ahishers", pats)
     print("Aho–Corasick matches:", [(pats[i], pos) for i, pos in hits])
-    # e.g. [('his', 2), ('he', 3), ('she', 4), ('hers', 7)]
+    # [('his', 3), ('she', 5), ('he', 5), ('hers', 7)]
+
+
+# # Substituição multi-padrão em streaming (Aho-Corasick)
+import io
+import re
+
+class AhoReplacer(AhoCorasick):
+    """
+    Substitui todas as ocorrências não sobrepostas dos padrões numa única
+    passada sobre o texto, que chega em chunks; a saída vai para um writer
+    (qualquer objeto com .write), nunca para uma string gigante.
+
+    mode="longest": leftmost-longest (na mesma posição vence o mais longo).
+    mode="first":   leftmost-first (na mesma posição vence o de menor índice).
+
+    Um match pendente só é confirmado quando nenhum match futuro pode começar
+    antes dele: todo match futuro começa em >= pos - depth(estado atual).
+    """
+    def __init__(self, patterns: list[str], replacements: list[str], mode: str = "longest"):
+        if len(patterns) != len(replacements):
+            raise ValueError("patterns e replacements devem ter o mesmo tamanho")
+        if mode not in ("longest", "first"):
+            raise ValueError("mode deve ser 'longest' ou 'first'")
+        if any(not p for p in patterns):
+            raise ValueError("padrão vazio não é permitido")
+        super().__init__(patterns)
+        self.lens = [len(p) for p in patterns]
+        self.replacements = replacements
+        self.mode = mode
+
+    def _key(self, m):
+        start, end, idx = m
+        return (start, -end) if self.mode == "longest" else (start, idx)
+
+    def replace_stream(self, chunks, writer) -> int:
+        """
+        chunks: iterável de str; writer: objeto com .write(str).
+        Retorna o número de substituições feitas.
+        """
+        root, lens, reps, key = self.root, self.lens, self.replacements, self._key
+        node = root
+        pos = 0          # posição absoluta do próximo caractere
+        emitted = 0      # tudo antes disto já foi escrito
+        buf, buf_start = "", 0
+        pending = []     # matches candidatos (start, end, idx), start >= emitted
+        count = 0
+        for chunk in chunks:
+            buf += chunk
+            for ch in chunk:
+                while node is not root and ch not in node.next:
+                    node = node.fail
+                node = node.next.get(ch, root)
+                pos += 1
+                bound = pos - node.depth
+                # confirma os matches que nenhum match futuro pode superar
+                while pending:
+                    best = min(pending, key=key)
+                    if best[0] >= bound:
+                        break
+                    start, end, idx = best
+                    writer.write(buf[emitted - buf_start:start - buf_start])
+                    writer.write(reps[idx])
+                    count += 1
+                    emitted = end
+                    pending = [m for m in pending if m[0] >= emitted]
+                for idx in node.out:
+                    start = pos - lens[idx]
+                    if start >= emitted:
+                        pending.append((start, pos, idx))
+            # escreve o texto que já não pode fazer parte de nenhum match
+            safe = min([pos - node.depth] + [m[0] for m in pending])
+            if safe > emitted:
+                writer.write(buf[emitted - buf_start:safe - buf_start])
+                emitted = safe
+            buf, buf_start = buf[emitted - buf_start:], emitted
+        # fim do fluxo: confirma o que restou
+        while pending:
+            start, end, idx = min(pending, key=key)
+            writer.write(buf[emitted - buf_start:start - buf_start])
+            writer.write(reps[idx])
+            count += 1
+            emitted = end
+            pending = [m for m in pending if m[0] >= emitted]
+        writer.write(buf[emitted - buf_start:])
+        return count
+
+    def replace(self, text: str) -> str:
+        """Atalho para textos que cabem em memória."""
+        out = io.StringIO()
+        self.replace_stream([text], out)
+        return out.getvalue()
+
+if __name__ == "__main__":
+    ar = AhoReplacer(["he", "she", "hers", "his"], ["[HE]", "[SHE]", "[HERS]", "[HIS]"])
+    print(ar.replace("ahishers"))  # a[HIS][HERS]
+    ar = AhoReplacer(["ab", "abcd", "c"], ["X", "Y", "Z"])
+    print(ar.replace("abce abcd"))  # XZe Y
+    out = io.StringIO()
+    ar.replace_stream(["ab", "c", "e a", "bc", "d"], out)
+    print(out.getvalue())          # XZe Y
+    print(AhoReplacer(["ab", "abcd"], ["X", "Y"], mode="first").replace("abcd"))  # Xcd
+
+    # benchmark: 10k padrões de PII num log
+    rnd = random.Random(1)
+    pii = [f"user{i:05d}@mail.com" for i in range(10_000)]
+    words = ["GET", "/api", "200", "ok", "latency=12ms", "from"]
+    log = " ".join(rnd.choice(pii) if rnd.random() < 0.1 else rnd.choice(words)
+                   for _ in range(20_000))
+    chunks = [log[i:i + 4096] for i in range(0, len(log), 4096)]
+
+    t0 = time.perf_counter()
+    ar = AhoReplacer(pii, ["<PII>"] * len(pii))
+    t1 = time.perf_counter()
+    out = io.StringIO()
+    ar.replace_stream(chunks, out)
+    t2 = time.perf_counter()
+    print(f"Aho-Corasick: build {t1 - t0:.2f}s, replace {t2 - t1:.2f}s")
+
+    t0 = time.perf_counter()
+    chained = log
+    for p in pii:
+        chained = chained.replace(p, "<PII>")
+    print(f"str.replace encadeado: {time.perf_counter() - t0:.2f}s")
+
+    t0 = time.perf_counter()
+    rx = re.compile("|".join(map(re.escape, sorted(pii, key=len, reverse=True))))
+    subbed = rx.sub("<PII>", log)
+    print(f"re.sub com alternância: {time.perf_counter() - t0:.2f}s")
+    print(out.getvalue() == chained == subbed)  # True
 
 
 # # Suffix Array + LCP
@@ -190,70 +638,167 @@ if __name__ == "__main__":
 
 # # Trie com compressão
 class CompressedTrieNode:
-    def __init__(self):
-        self.children = {}  # label_str → CompressedTrieNode
-        self.is_end = False
+    __slots__ = ("label", "children", "is_end")
+
+    def __init__(self, label: str = "", is_end: bool = False):
+        self.label = label    # rótulo da aresta que chega neste nó
+        self.children = {}    # primeiro char do rótulo → CompressedTrieNode
+        self.is_end = is_end
+
+def _write_varint(out: bytearray, x: int) -> None:
+    while x >= 0x80:
+        out.append((x & 0x7F) | 0x80)
+        x >>= 7
+    out.append(x)
+
+def _read_varint(data: bytes, i: int) -> tuple[int, int]:
+    x = shift = 0
+    while True:
+        b = data[i]
+        i += 1
+        x |= (b & 0x7F) << shift
+        if b < 0x80:
+            return x, i
+        shift += 7
 
 class CompressedTrie:
+    """
+    Radix tree: cada aresta guarda uma substring. Os filhos são indexados
+    pelo primeiro caractere do rótulo, então escolher a aresta é O(1).
+    """
     def __init__(self):
         self.root = CompressedTrieNode()
 
     def insert(self, word: str) -> None:
         node = self.root
-        while word:
-            # tenta achar aresta com prefixo comum
-            for label, child in list(node.children.items()):
-                # encontra o maior prefixo comum entre label e word
-                common = ""
-                for x, y in zip(label, word):
-                    if x == y:
-                        common += x
-                    else:
-                        break
-                if common:
-                    # caso 1: label é todo prefixo
-                    if common == label:
-                        word = word[len(common):]
-                        node = child
-                    else:
-                        # split da aresta
-                        suffix_label = label[len(common):]
-                        new_child = CompressedTrieNode()
-                        new_child.children[suffix_label] = child
-                        new_child.is_end = False
-                        node.children.pop(label)
-                        node.children[common] = new_child
-                        # resto de word
-                        word = word[len(common):]
-                        if word:
-                            new2 = CompressedTrieNode()
-                            new2.is_end = True
-                            new_child.children[word] = new2
-                        else:
-                            new_child.is_end = True
-                        return
-                    break
-            else:
+        i, n = 0, len(word)
+        while i < n:
+            child = node.children.get(word[i])
+            if child is None:
                 # sem prefixo comum, cria aresta nova
-                new = CompressedTrieNode()
-                new.is_end = True
-                node.children[word] = new
+                node.children[word[i]] = CompressedTrieNode(word[i:], True)
                 return
+            label = child.label
+            if word.startswith(label, i):
+                # caso 1: label é todo prefixo
+                i += len(label)
+                node = child
+                continue
+            # maior prefixo comum entre label e word[i:] (o 1º char já casa)
+            k, lim = 1, min(len(label), n - i)
+            while k < lim and label[k] == word[i + k]:
+                k += 1
+            # split da aresta
+            mid = CompressedTrieNode(label[:k])
+            node.children[word[i]] = mid
+            child.label = label[k:]
+            mid.children[child.label[0]] = child
+            i += k
+            if i == n:
+                mid.is_end = True
+            else:
+                mid.children[word[i]] = CompressedTrieNode(word[i:], True)
+            return
         # palavra vazia depois de percorrer arestas
         node.is_end = True
 
     def search(self, word: str) -> bool:
         node = self.root
-        while word:
-            for label, child in node.children.items():
-                if word.startswith(label):
-                    word = word[len(label):]
-                    node = child
-                    break
-            else:
+        i, n = 0, len(word)
+        while i < n:
+            child = node.children.get(word[i])
+            if child is None or not word.startswith(child.label, i):
                 return False
+            i += len(child.label)
+            node = child
         return node.is_end
 
+    @classmethod
+    def from_sorted(cls, words) -> "CompressedTrie":
+        """
+        Constrói a partir de palavras em ordem crescente em O(total de chars):
+        só o caminho mais à direita pode mudar, então basta uma pilha
+        (nó, profundidade) e o LCP com a palavra anterior.
+        """
+        trie = cls()
+        stack = [(trie.root, 0)]
+        prev = None
+        for w in words:
+            if prev is not None:
+                if w == prev:
+                    continue
+                if w < prev:
+                    raise ValueError("from_sorted exige palavras ordenadas")
+            # LCP com a palavra anterior
+            l, lim = 0, min(len(w), len(prev)) if prev is not None else 0
+            while l < lim and w[l] == prev[l]:
+                l += 1
+            # sobe até o nó mais fundo com profundidade <= l
+            popped = None
+            while stack[-1][1] > l:
+                popped = stack.pop()
+            parent, pdepth = stack[-1]
+            if pdepth < l:
+                # o LCP termina no meio da aresta de popped: split
+                child, _ = popped
+                cut = l - pdepth
+                mid = CompressedTrieNode(child.label[:cut])
+                parent.children[mid.label[0]] = mid
+                child.label = child.label[cut:]
+                mid.children[child.label[0]] = child
+                stack.append((mid, l))
+                parent = mid
+            if len(w) == l:
+                parent.is_end = True   # só a palavra vazia chega aqui
+            else:
+                leaf = CompressedTrieNode(w[l:], True)
+                parent.children[w[l]] = leaf
+                stack.append((leaf, len(w)))
+            prev = w
+        return trie
+
+    def serialize(self) -> bytes:
+        """
+        Formato compacto em pré-ordem; por nó:
+        varint(len(label_utf8)) + label_utf8 + varint(n_filhos << 1 | is_end).
+        """
+        out = bytearray()
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            label = node.label.encode("utf-8")
+            _write_varint(out, len(label))
+            out += label
+            _write_varint(out, len(node.children) << 1 | node.is_end)
+            # empilha ao contrário para gravar os filhos em ordem
+            stack.extend(node.children[k] for k in sorted(node.children, reverse=True))
+        return bytes(out)
+
+    @classmethod
+    def load(cls, data: bytes) -> "CompressedTrie":
+        """Reconstrói o trie gravado por serialize()."""
+        trie = cls()
+        i = 0
+        parents = []  # pilha de [nó, filhos que ainda faltam ler]
+        while i < len(data):
+            size, i = _read_varint(data, i)
+            label = data[i:i + size].decode("utf-8")
+            i += size
+            meta, i = _read_varint(data, i)
+            if not parents:
+                node = trie.root
+            else:
+                node = CompressedTrieNode(label)
+                top = parents[-1]
+                top[0].children[label[0]] = node
+                top[1] -= 1
+                if top[1] == 0:
+                    parents.pop()
+            node.is_end = bool(meta & 1)
+            if meta >> 1:
+                parents.append([node, meta >> 1])
+        return trie
+
 if __name__ == "__main__":
     trie = CompressedTrie()
     for w in ["test", "team", "teal"]:
@@ -261,3 +806,7 @@ if __name__ == "__main__":
     print(trie.search("team"))  # True
     print(trie.search("tea"))   # False
     print(trie.search("teal"))  # True
+
+    bulk = CompressedTrie.from_sorted(["teal", "team", "test", "toast"])
+    again = CompressedTrie.load(bulk.serialize())
+    print(again.search("toast"), again.search("te"))  # True False
@@ -278,32 +278,85 @@ if __name__ == "__main__":
 
 
 # # Autocompletar com Trie
+import heapq
+from bisect import insort
+
 class TrieNode:
     def __init__(self):
         self.children = {}
         self.is_end = False
+        self.score = 0
+        self.top = []  # até top_k pares (-score, palavra), melhores primeiro
 
 class Autocomplete:
-    def __init__(self, words):
+    """
+    Trie de autocompletar com pontuação. Cada nó guarda em cache as top_k
+    melhores palavras da sua subárvore, mantidas a cada insert; assim
+    suggest(prefix, k) custa O(|prefix| + k) em vez de uma DFS completa.
+    """
+    def __init__(self, words, top_k=10):
         self.root = TrieNode()
-        for w in words:
-            node = self.root
-            for ch in w:
-                if ch not in node.children:
-                    node.children[ch] = TrieNode()
-                node = node.children[ch]
-            node.is_end = True
-
-    def suggest(self, prefix):
+        self.top_k = top_k
+        items = words.items() if isinstance(words, dict) else ((w, 0) for w in words)
+        for w, score in items:
+            self.insert(w, score)
+
+    def insert(self, word, score=0):
+        """Insere word com a pontuação dada (ou atualiza a pontuação)."""
+        path = [self.root]
+        node = self.root
+        for ch in word:
+            if ch not in node.children:
+                node.children[ch] = TrieNode()
+            node = node.children[ch]
+            path.append(node)
+        existed = node.is_end
+        node.is_end = True
+        node.score = score
+        if not existed:
+            entry = (-score, word)
+            for n in path:
+                insort(n.top, entry)
+                if len(n.top) > self.top_k:
+                    n.top.pop()
+        else:
+            # a pontuação mudou: recalcula os caches do nó até a raiz
+            # (uma palavra que tinha sido cortada pode voltar ao top-k)
+            for depth in range(len(word), -1, -1):
+                self._refresh(path[depth], word[:depth])
+
+    def _refresh(self, node, prefix):
+        own = [(-node.score, prefix)] if node.is_end else []
+        node.top = heapq.nsmallest(
+            self.top_k, heapq.merge(own, *(c.top for c in node.children.values())))
+
+    def suggest(self, prefix, k=None):
+        """
+        Sem k: todas as completações (ordem da DFS).
+        Com k: as k de maior pontuação (empate → ordem alfabética).
+        """
         node = self.root
         for ch in prefix:
             if ch not in node.children:
                 return []
             node = node.children[ch]
+        if k is not None:
+            if k <= self.top_k:
+                return [w for _, w in node.top[:k]]
+            return [w for _, w in heapq.nsmallest(k, self._entries(node, prefix))]
         results = []
         self._dfs(node, prefix, results)
         return results
 
+    def _entries(self, node, prefix):
+        stack = [(node, prefix)]
+        while stack:
+            node, path = stack.pop()
+            if node.is_end:
+                yield (-node.score, path)
+            for ch, nxt in node.children.items():
+                stack.append((nxt, path + ch))
+
     def _dfs(self, node, path, res):
         if node.is_end:
             res.append(path)
@@ -314,6 +367,431 @@ if __name__ == "__main__":
     ac = Autocomplete(["auto","autocomplete","author","aux","banana"])
     print(ac.suggest("au"))  # ['auto','autocomplete','author','aux']
 
+    ranked = Autocomplete({"auto": 5, "autocomplete": 9, "author": 7, "aux": 1, "banana": 3}, top_k=3)
+    print(ranked.suggest("au", 2))  # ['autocomplete', 'author']
+    ranked.insert("autocomplete", 0)
+    print(ranked.suggest("au", 3))  # ['author', 'auto', 'aux']
+
+
+# # Autocompletar tolerante a erros (Levenshtein sobre o Trie)
+def fuzzy_complete(root, prefix, d):
+    """
+    Nós do trie cujo caminho está a distância de edição <= d de prefix.
+    Desce o trie carregando uma linha da DP de Levenshtein por profundidade
+    e poda a subárvore assim que o mínimo da linha passa de d. Ao casar,
+    não desce mais: toda a subárvore já é completação válida.
+    Serve para qualquer trie com nós .children/.is_end (Autocomplete, Trie).
+    Retorna lista de (nó, caminho, distância).
+    """
+    m = len(prefix)
+    first = list(range(m + 1))
+    if first[m] <= d:
+        return [(root, "", first[m])]
+    found = []
+    stack = [(root, "", first)]
+    while stack:
+        node, path, row = stack.pop()
+        for ch, nxt in node.children.items():
+            new = [row[0] + 1]
+            for j in range(1, m + 1):
+                new.append(min(new[j - 1] + 1, row[j] + 1,
+                               row[j - 1] + (prefix[j - 1] != ch)))
+            if new[m] <= d:
+                found.append((nxt, path + ch, new[m]))
+            elif min(new) <= d:
+                stack.append((nxt, path + ch, new))
+    return found
+
+def fuzzy_suggest(ac, prefix, d, k=None):
+    """
+    Completações de palavras cujo começo está a até d edições de prefix.
+    Com k, devolve as k de maior pontuação usando os caches top-k dos nós.
+    """
+    matches = fuzzy_complete(ac.root, prefix, d)
+    if k is not None and k <= ac.top_k:
+        tops = heapq.merge(*(node.top for node, _, _ in matches))
+        return [w for _, w in heapq.nsmallest(k, tops)]
+    entries = [e for node, path, _ in matches for e in ac._entries(node, path)]
+    if k is not None:
+        return [w for _, w in heapq.nsmallest(k, entries)]
+    return [w for _, w in entries]
+
+if __name__ == "__main__":
+    ac = Autocomplete({"auto": 5, "autocomplete": 9, "author": 7, "aux": 1, "banana": 3})
+    print(sorted(fuzzy_suggest(ac, "atu", 1)))  # ['author', 'auto', 'autocomplete', 'aux']
+    print(fuzzy_suggest(ac, "bamana", 1, k=2))  # ['banana']
+    print(fuzzy_suggest(ac, "aut", 1, k=2))     # ['autocomplete', 'author']
+
+    # latência com d = 1, 2 contra a DP contra cada palavra do dicionário
+    import random, time
+    rnd = random.Random(0)
+    words = {"".join(rnd.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rnd.randint(3, 12))): rnd.random()
+             for _ in range(50_000)}
+    ac = Autocomplete(words)
+    queries = [w[:5] for w in list(words)[:20] if len(w) >= 5]
+
+    def brute(q, d):
+        # distância de q até o melhor prefixo de cada palavra
+        res = []
+        for w in words:
+            row = list(range(len(q) + 1))
+            best = row[-1]
+            for ch in w:
+                new = [row[0] + 1]
+                for j in range(1, len(q) + 1):
+                    new.append(min(new[j - 1] + 1, row[j] + 1, row[j - 1] + (q[j - 1] != ch)))
+                row = new
+                best = min(best, row[-1])
+            if best <= d:
+                res.append(w)
+        return res
+
+    for d in (1, 2):
+        t0 = time.perf_counter()
+        for q in queries:
+            fuzzy_suggest(ac, q, d, k=10)
+        t1 = time.perf_counter()
+        brute(queries[0], d)
+        t2 = time.perf_counter()
+        print(f"d={d}: trie {1000 * (t1 - t0) / len(queries):.2f} ms/consulta, "
+              f"DP por palavra {1000 * (t2 - t1):.0f} ms/consulta")
+
+
+# # Trie imutável em arquivo (mmap)
+import mmap
+import struct
+from array import array
+
+_MTRIE_MAGIC = b"MTRI"
+_MTRIE_HEADER = struct.Struct("<4sIIII8Q")  # magic, versão, nós, palavras, top_k, 8 offsets
+
+def build_trie_file(words, path, top_k=10):
+    """
+    Builder offline: grava um trie sem ponteiros (só índices em vetores
+    contíguos) que MappedTrie lê direto do page cache.
+    Nós em ordem BFS, logo os filhos de cada nó são contíguos e ordenados.
+    Seções (alinhadas em 8 bytes):
+      first_child u32[n], n_children u32[n], label u32[n] (code point),
+      word_id i32[n] (-1 se não terminal), top_off u32[n+1], top_ids u32[],
+      word_off u32[W+1], blob utf-8.
+    word_id = posição da palavra na ordem (-score, palavra), então o top-k
+    de um nó são simplesmente os k menores ids da subárvore.
+    top_k=0 não grava caches (suggest percorre a subárvore).
+    """
+    if top_k < 0:
+        raise ValueError("top_k deve ser >= 0")
+    items = words.items() if isinstance(words, dict) else ((w, 0) for w in words)
+    ranked = sorted({w: s for w, s in items}.items(), key=lambda x: (-x[1], x[0]))
+    # trie temporário em dicts, só durante o build
+    root = {}
+    for wid, (w, _) in enumerate(ranked):
+        node = root
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = wid  # marcador de fim
+    order, labels = [root], [0]
+    first_child, n_children, word_id = [], [], []
+    qi = 0
+    while qi < len(order):
+        node = order[qi]; qi += 1
+        word_id.append(node.get("", -1))
+        kids = sorted(ch for ch in node if ch)
+        first_child.append(len(order))
+        n_children.append(len(kids))
+        for ch in kids:
+            order.append(node[ch])
+            labels.append(ord(ch))
+    # top-k de baixo para cima (ordem BFS invertida)
+    tops = [None] * len(order)
+    for i in range(len(order) - 1, -1, -1):
+        own = [word_id[i]] if word_id[i] >= 0 else []
+        kids = range(first_child[i], first_child[i] + n_children[i])
+        tops[i] = heapq.nsmallest(top_k, heapq.merge(own, *(tops[c] for c in kids)))
+    top_off = array('I', [0])
+    for t in tops:
+        top_off.append(top_off[-1] + len(t))
+    blobs = [w.encode("utf-8") for w, _ in ranked]
+    word_off = array('I', [0])
+    for b in blobs:
+        word_off.append(word_off[-1] + len(b))
+    sections = [array('I', first_child).tobytes(), array('I', n_children).tobytes(),
+                array('I', labels).tobytes(), array('i', word_id).tobytes(),
+                top_off.tobytes(), array('I', (x for t in tops for x in t)).tobytes(),
+                word_off.tobytes(), b"".join(blobs)]
+    offsets, pos = [], _MTRIE_HEADER.size
+    for sec in sections:
+        pos = (pos + 7) & ~7
+        offsets.append(pos)
+        pos += len(sec)
+    with open(path, "wb") as f:
+        f.write(_MTRIE_HEADER.pack(_MTRIE_MAGIC, 1, len(order), len(ranked), top_k, *offsets))
+        for off, sec in zip(offsets, sections):
+            f.write(b"\0" * (off - f.tell()))
+            f.write(sec)
+
+class MappedTrie:
+    """
+    Leitor do arquivo de build_trie_file via mmap: nada é desserializado,
+    cada consulta indexa memoryviews sobre as páginas mapeadas. N processos
+    que abrem o mesmo arquivo compartilham uma única cópia no page cache
+    e a abertura custa milissegundos.
+    """
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, n, w, self.top_k, *offs = _MTRIE_HEADER.unpack_from(self._mm)
+        if magic != _MTRIE_MAGIC or version != 1:
+            raise ValueError(f"{path}: não é um arquivo de trie válido")
+        view = memoryview(self._mm)
+        sizes = [4 * n, 4 * n, 4 * n, 4 * n, 4 * (n + 1), None, 4 * (w + 1), None]
+        top_total = struct.unpack_from("<I", self._mm, offs[4] + 4 * n)[0]
+        sizes[5] = 4 * top_total
+        sizes[7] = len(self._mm) - offs[7]
+        fmts = ["I", "I", "I", "i", "I", "I", "I", None]
+        secs = [view[o:o + s].cast(fm) if fm else view[o:o + s]
+                for o, s, fm in zip(offs, sizes, fmts)]
+        (self._first, self._count, self._label, self._word_id,
+         self._top_off, self._top_ids, self._word_off, self._blob) = secs
+
+    def close(self):
+        for name in ("_first", "_count", "_label", "_word_id",
+                     "_top_off", "_top_ids", "_word_off", "_blob"):
+            getattr(self, name).release()
+        self._mm.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _child(self, node, ch):
+        # busca binária entre os filhos (ordenados por code point)
+        label, c = self._label, ord(ch)
+        lo = self._first[node]
+        hi = lo + self._count[node]
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if label[mid] < c:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < self._first[node] + self._count[node] and label[lo] == c else -1
+
+    def _walk(self, s):
+        node = 0
+        for ch in s:
+            node = self._child(node, ch)
+            if node < 0:
+                return -1
+        return node
+
+    def _word(self, wid):
+        return str(self._blob[self._word_off[wid]:self._word_off[wid + 1]], "utf-8")
+
+    def search(self, word):
+        node = self._walk(word)
+        return node >= 0 and self._word_id[node] >= 0
+
+    def starts_with(self, prefix):
+        node = self._walk(prefix)
+        # o builder não grava nós mortos: todo nó além da raiz tem palavra abaixo
+        return node > 0 or (node == 0 and len(self._word_off) > 1)
+
+    def suggest(self, prefix, k=10):
+        """As k melhores completações (mesma ordem de Autocomplete.suggest(prefix, k))."""
+        node = self._walk(prefix)
+        if node < 0:
+            return []
+        if k <= self.top_k:
+            lo = self._top_off[node]
+            hi = min(self._top_off[node + 1], lo + k)
+            return [self._word(self._top_ids[i]) for i in range(lo, hi)]
+        ids, stack = [], [node]
+        while stack:
+            u = stack.pop()
+            if self._word_id[u] >= 0:
+                ids.append(self._word_id[u])
+            stack.extend(range(self._first[u], self._first[u] + self._count[u]))
+        return [self._word(i) for i in heapq.nsmallest(k, ids)]
+
+if __name__ == "__main__":
+    import os, random, tempfile, time
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "words.trie")
+        build_trie_file({"auto": 5, "autocomplete": 9, "author": 7, "aux": 1, "banana": 3}, path)
+        with MappedTrie(path) as mt:
+            print(mt.search("auto"), mt.search("aut"), mt.starts_with("ban"))  # True False True
+            print(mt.suggest("au", 2))  # ['autocomplete', 'author']
+
+        # tempo de "boot": reconstruir o Autocomplete x abrir o arquivo mapeado
+        rnd = random.Random(0)
+        words = {"".join(rnd.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rnd.randint(3, 12))): rnd.randint(0, 1000)
+                 for _ in range(50_000)}
+        t0 = time.perf_counter()
+        build_trie_file(words, path)
+        t1 = time.perf_counter()
+        ac = Autocomplete(words)
+        t2 = time.perf_counter()
+        mt = MappedTrie(path)
+        t3 = time.perf_counter()
+        print(f"build offline {t1 - t0:.2f}s, Autocomplete {t2 - t1:.2f}s, "
+              f"mmap {1000 * (t3 - t2):.2f} ms, arquivo {os.path.getsize(path)} bytes")
+        print(all(mt.suggest(p, 5) == ac.suggest(p, 5) for p in ["a", "ab", "zz", "qwe"]))  # True
+        mt.close()
+
+
+# # Trie persistente (copy-on-write) para leituras sem lock
+import threading
+
+class PNode:
+    """Nó imutável depois de publicado; nunca é alterado, só substituído."""
+    __slots__ = ("children", "is_end", "score", "top")
+
+    def __init__(self, children, is_end, score, top):
+        self.children = children  # char → PNode
+        self.is_end = is_end
+        self.score = score
+        self.top = top            # tupla de até top_k (-score, palavra)
+
+class PersistentAutocomplete:
+    """
+    Autocomplete com path copying: insert copia só os nós do caminho
+    (O(|word|·σ)) e publica a nova raiz com uma única atribuição, que é
+    atômica. Leitores usam a raiz que pegaram (um snapshot imutável) sem
+    lock; versões antigas somem sozinhas pela contagem de referências
+    quando nenhum leitor as usa mais. Só os escritores se serializam.
+    O ganho é de consistência (um leitor nunca vê um insert pela metade nem
+    espera um escritor), não de vazão: no CPython o GIL já serializa as
+    leituras, que custam só O(|prefixo| + k). No demo a vazão de leitura
+    oscila entre execuções e não tem vencedor fixo (ex.: 1,70M x 1,97M
+    leituras/s para a versão com mutex numa execução; 1,8–3,7M x 0,6–1,2M
+    em outras), pois depende de como o GIL alterna leitores e escritor.
+    """
+    def __init__(self, words=(), top_k=10):
+        self.top_k = top_k
+        self.root = PNode({}, False, 0, ())
+        self._write_lock = threading.Lock()
+        items = words.items() if isinstance(words, dict) else ((w, 0) for w in words)
+        for w, score in items:
+            self.insert(w, score)
+
+    def snapshot(self):
+        """Raiz atual; continua válida mesmo após novos inserts."""
+        return self.root
+
+    def insert(self, word, score=0):
+        with self._write_lock:
+            path = [self.root]
+            node = self.root
+            for ch in word:
+                node = node.children.get(ch) if node else None
+                path.append(node)
+            existed = path[-1] is not None and path[-1].is_end
+            entry = (-score, word)
+            child = None
+            # reconstrói o caminho de baixo para cima
+            for depth in range(len(word), -1, -1):
+                old = path[depth]
+                children = dict(old.children) if old else {}
+                if depth < len(word):
+                    children[word[depth]] = child
+                if depth == len(word):
+                    is_end, sc = True, score
+                else:
+                    is_end, sc = (old.is_end, old.score) if old else (False, 0)
+                if existed:
+                    # pontuação mudou: recalcula a partir dos filhos
+                    own = [(-sc, word[:depth])] if is_end else []
+                    top = tuple(heapq.nsmallest(self.top_k, heapq.merge(
+                        own, *(c.top for c in children.values()))))
+                else:
+                    top = list(old.top) if old else []
+                    insort(top, entry)
+                    top = tuple(top[:self.top_k])
+                child = PNode(children, is_end, sc, top)
+            self.root = child  # publicação atômica da nova versão
+
+    def search(self, word, root=None):
+        node = root or self.root
+        for ch in word:
+            node = node.children.get(ch)
+            if node is None:
+                return False
+        return node.is_end
+
+    def suggest(self, prefix, k=10, root=None):
+        """As k melhores completações no snapshot `root` (padrão: o atual)."""
+        node = root or self.root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return []
+        if k <= self.top_k:
+            return [w for _, w in node.top[:k]]
+        entries, stack = [], [(node, prefix)]
+        while stack:
+            node, path = stack.pop()
+            if node.is_end:
+                entries.append((-node.score, path))
+            for ch, nxt in node.children.items():
+                stack.append((nxt, path + ch))
+        return [w for _, w in heapq.nsmallest(k, entries)]
+
+if __name__ == "__main__":
+    pac = PersistentAutocomplete({"auto": 5, "author": 7, "aux": 1})
+    old = pac.snapshot()
+    pac.insert("autocomplete", 9)
+    print(pac.suggest("au", 2))            # ['autocomplete', 'author']
+    print(pac.suggest("au", 2, root=old))  # ['author', 'auto']  (snapshot antigo)
+
+    # vazão de leitura com um escritor em paralelo: snapshot x trie com mutex
+    # (com o GIL os números oscilam entre execuções; nenhum dos dois vence sempre)
+    rnd = random.Random(2)
+    alphabet = "abcdefghijklmnopqrstuvwxyz"
+    base_words = {"".join(rnd.choice(alphabet) for _ in range(rnd.randint(3, 10))): rnd.randint(0, 1000)
+                  for _ in range(20_000)}
+    new_words = ["".join(rnd.choice(alphabet) for _ in range(8)) for _ in range(200_000)]
+    prefixes = [w[:2] for w in list(base_words)[:1000]]
+
+    class LockedAutocomplete:
+        def __init__(self, words):
+            self.ac = Autocomplete(words)
+            self.lock = threading.Lock()
+        def insert(self, word, score):
+            with self.lock:
+                self.ac.insert(word, score)
+        def suggest(self, prefix, k):
+            with self.lock:
+                return self.ac.suggest(prefix, k)
+
+    def bench(store, readers=8, seconds=0.5):
+        stop = threading.Event()
+        counts = [0] * readers
+        def reader(i):
+            n = 0
+            while not stop.is_set():
+                store.suggest(prefixes[n % len(prefixes)], 5)
+                n += 1
+            counts[i] = n
+        def writer():
+            for i, w in enumerate(new_words):
+                if stop.is_set():
+                    break
+                store.insert(w, i % 1000)
+        threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+        threads.append(threading.Thread(target=writer))
+        for t in threads:
+            t.start()
+        time.sleep(seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+        return sum(counts) / seconds
+
+    print(f"mutex: {bench(LockedAutocomplete(base_words)):,.0f} leituras/s")
+    print(f"snapshot: {bench(PersistentAutocomplete(base_words)):,.0f} leituras/s")
+
 
 # # Algoritmo de compressão (Huffman)
 class Node:
@@ -346,6 +346,358 @@ if __name__ == "__main__":
     print(trie.starts_with("dog"))    # False
 
 
+# # Double-Array Trie (base/check)
+from array import array
+
+class DoubleArrayTrie:
+    """
+    Trie estático em dois vetores de inteiros: a transição s --c--> t existe
+    sse t = base[s] + code(c) e check[t] == s. Sem um objeto/dict por nó:
+    ~9 bytes por estado, guardados em array('i') + bytearray.
+    Construído uma vez a partir de um conjunto ordenado de chaves.
+    """
+    def __init__(self, keys):
+        keys = list(keys)
+        if any(keys[i] >= keys[i + 1] for i in range(len(keys) - 1)):
+            keys = sorted(set(keys))
+        self.n_keys = len(keys)
+        self.chars = sorted({ch for k in keys for ch in k})
+        self.code = {ch: i + 1 for i, ch in enumerate(self.chars)}  # 0 não é usado
+        size = max(256, 2 * sum(map(len, keys)))
+        self.base = array('i', [0]) * size
+        self.check = array('i', [-1]) * size   # -1 = célula livre
+        self.term = bytearray(size)
+        self.check[0] = -2                     # raiz (estado 0) ocupada
+        self._build(keys)
+
+    def _grow(self, need: int) -> None:
+        extra = max(need + 1, 2 * len(self.check)) - len(self.check)
+        self.base.extend(array('i', [0]) * extra)
+        self.check.extend(array('i', [-1]) * extra)
+        self.term.extend(bytearray(extra))
+
+    def _build(self, keys: list[str]) -> None:
+        code = self.code
+        # lista duplamente ligada das células livres (só durante a construção)
+        n = len(self.check)
+        nxt = list(range(1, n + 1))
+        prv = list(range(-1, n - 1))
+        nxt[-1] = -1
+        head, tail = 1, n - 1
+        prv[1] = -1
+
+        def extend(need):
+            nonlocal head, tail
+            old = len(self.check)
+            self._grow(need)
+            new = len(self.check)
+            nxt.extend(range(old + 1, new + 1))
+            prv.extend(range(old - 1, new - 1))
+            nxt[-1] = -1
+            if tail == -1:
+                head = old
+                prv[old] = -1
+            else:
+                nxt[tail] = old
+            tail = new - 1
+
+        def take(i):
+            nonlocal head, tail
+            p, q = prv[i], nxt[i]
+            if p == -1:
+                head = q
+            else:
+                nxt[p] = q
+            if q == -1:
+                tail = p
+            else:
+                prv[q] = p
+
+        used = 0
+        stack = [(0, 0, len(keys), 0)]  # (estado, lo, hi, profundidade)
+        while stack:
+            s, lo, hi, d = stack.pop()
+            if lo < hi and len(keys[lo]) == d:
+                self.term[s] = 1
+                lo += 1
+            if lo == hi:
+                continue
+            # agrupa as chaves de [lo, hi) pelo caractere na posição d
+            groups = []
+            i = lo
+            while i < hi:
+                ch = keys[i][d]
+                j = i + 1
+                while j < hi and keys[j][d] == ch:
+                    j += 1
+                groups.append((code[ch], i, j))
+                i = j
+            codes = [c for c, _, _ in groups]
+            # first-fit sobre as células livres: o primeiro filho cai em p
+            p = head
+            while True:
+                if p == -1:
+                    p = len(self.check)
+                    extend(p)
+                b = p - codes[0]
+                if b >= 1:
+                    if b + codes[-1] >= len(self.check):
+                        extend(b + codes[-1])
+                    check = self.check
+                    if all(check[b + c] == -1 for c in codes):
+                        break
+                p = nxt[p]
+            self.base[s] = b
+            for c, _, _ in groups:
+                check[b + c] = s
+                take(b + c)
+                used = max(used, b + c)
+            for c, i, j in reversed(groups):
+                stack.append((b + c, i, j, d + 1))
+        # descarta a folga do fim dos vetores
+        del self.base[used + 1:], self.check[used + 1:], self.term[used + 1:]
+
+    def _walk(self, s: str) -> int:
+        """Estado alcançado ao consumir s a partir da raiz, ou -1."""
+        base, check, code = self.base, self.check, self.code
+        n = len(check)
+        state = 0
+        for ch in s:
+            c = code.get(ch)
+            if c is None:
+                return -1
+            t = base[state] + c
+            if t >= n or check[t] != state:
+                return -1
+            state = t
+        return state
+
+    def search(self, word: str) -> bool:
+        """Retorna True se a palavra exata está no trie."""
+        # laço de _walk repetido aqui: é o caminho quente das buscas
+        base, check, code = self.base, self.check, self.code
+        n = len(check)
+        state = 0
+        for ch in word:
+            c = code.get(ch)
+            if c is None:
+                return False
+            t = base[state] + c
+            if t >= n or check[t] != state:
+                return False
+            state = t
+        return self.term[state] == 1
+
+    def starts_with(self, prefix: str) -> bool:
+        """Retorna True se alguma chave começa com o prefixo."""
+        return self.n_keys > 0 and self._walk(prefix) >= 0
+
+    def keys_with_prefix(self, prefix: str):
+        """Gera, em ordem lexicográfica, as chaves que começam com o prefixo."""
+        s = self._walk(prefix)
+        if s < 0:
+            return
+        base, check, term, chars = self.base, self.check, self.term, self.chars
+        n = len(check)
+        stack = [(s, prefix)]
+        while stack:
+            s, path = stack.pop()
+            if term[s]:
+                yield path
+            b = base[s]
+            for c in range(len(chars), 0, -1):
+                t = b + c
+                if t < n and check[t] == s:
+                    stack.append((t, path + chars[c - 1]))
+
+    def longest_prefix_of(self, text: str) -> str | None:
+        """Maior chave que é prefixo de text (longest-prefix-match), ou None."""
+        base, check, code, term = self.base, self.check, self.code, self.term
+        n = len(check)
+        state, best = 0, (0 if term[0] else -1)
+        for i, ch in enumerate(text):
+            c = code.get(ch)
+            if c is None:
+                break
+            t = base[state] + c
+            if t >= n or check[t] != state:
+                break
+            state = t
+            if term[state]:
+                best = i + 1
+        return text[:best] if best >= 0 else None
+
+    def nbytes(self) -> int:
+        """Bytes ocupados pelos buffers base/check/term."""
+        return (len(self.base) * self.base.itemsize
+                + len(self.check) * self.check.itemsize + len(self.term))
+
+# Exemplo de uso:
+if __name__ == "__main__":
+    dat = DoubleArrayTrie(sorted(["cachorro", "carro", "casa", "gato"]))
+    print(dat.search("casa"), dat.search("cas"))    # True False
+    print(dat.starts_with("ca"), dat.starts_with("dog"))  # True False
+    print(list(dat.keys_with_prefix("ca")))        # ['cachorro', 'carro', 'casa']
+    print(dat.longest_prefix_of("gatos"))          # gato
+
+    # memória por chave e lookups/s contra o Trie de dicts
+    import random, time, tracemalloc
+    rnd = random.Random(0)
+    words = sorted({"".join(rnd.choice("abcdefghij") for _ in range(rnd.randint(4, 10)))
+                    for _ in range(50_000)})
+    queries = words[::2] + ["".join(rnd.choice("abcdefghij") for _ in range(7))
+                            for _ in range(len(words) // 2)]
+
+    tracemalloc.start()
+    trie = Trie()
+    for w in words:
+        trie.insert(w)
+    trie_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    dat = DoubleArrayTrie(words)
+    print(f"Trie: {trie_bytes / len(words):.0f} B/chave, "
+          f"DoubleArrayTrie: {dat.nbytes() / len(words):.0f} B/chave")
+
+    for name, t in [("Trie", trie), ("DoubleArrayTrie", dat)]:
+        t0 = time.perf_counter()
+        hits = sum(t.search(q) for q in queries)
+        dt = time.perf_counter() - t0
+        print(f"{name}: {len(queries) / dt:,.0f} lookups/s ({hits} hits)")
+
+
+# # Bloom Filter (filtro para buscas negativas)
+import math
+
+_M64 = 0xFFFFFFFFFFFFFFFF
+
+def _mix64(h: int) -> int:
+    """
+    Finalizador do splitmix64: espalha os 64 bits do hash. Necessário porque
+    hash(int) == int para inteiros pequenos, e aí h2 = h >> 32 seria sempre 0.
+    """
+    h &= _M64
+    h = ((h ^ (h >> 30)) * 0xBF58476D1CE4E5B9) & _M64
+    h = ((h ^ (h >> 27)) * 0x94D049BB133111EB) & _M64
+    return h ^ (h >> 31)
+
+class BloomFilter:
+    """
+    Filtro de Bloom em bytearray: sem falsos negativos, falsos positivos
+    com taxa ~fp_rate para até `capacity` chaves.
+    m = -n·ln(p)/ln(2)² bits e k = (m/n)·ln(2) funções de hash, obtidas por
+    double hashing (g_i = h1 + i·h2) a partir de um único hash de 64 bits,
+    misturado por _mix64 antes de ser dividido em h1 e h2.
+    Usa hash() do Python: rápido, mas não é estável entre processos,
+    então o filtro não deve ser persistido.
+    """
+    def __init__(self, capacity: int, fp_rate: float = 0.01):
+        if not 0 < fp_rate < 1:
+            raise ValueError("fp_rate deve estar em (0, 1)")
+        n = max(1, capacity)
+        self.m = max(8, int(-n * math.log(fp_rate) / math.log(2) ** 2))
+        self.k = max(1, round(self.m / n * math.log(2)))
+        self.bits = bytearray((self.m + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        h = _mix64(hash(key))
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        m = self.m
+        return [(h1 + i * h2) % m for i in range(self.k)]
+
+    def add(self, key) -> None:
+        bits = self.bits
+        for pos in self._positions(key):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def update(self, keys) -> None:
+        """Inserção em lote (evita o custo de chamada de método por chave)."""
+        bits, m, k = self.bits, self.m, self.k
+        for key in keys:
+            h = _mix64(hash(key))
+            h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+            for i in range(k):
+                pos = (h1 + i * h2) % m
+                bits[pos >> 3] |= 1 << (pos & 7)
+            self.count += 1
+
+    def __contains__(self, key) -> bool:
+        """False = com certeza ausente; True = provavelmente presente."""
+        bits, m = self.bits, self.m
+        h = _mix64(hash(key))
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        for i in range(self.k):
+            pos = (h1 + i * h2) % m
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+class BloomFront:
+    """
+    Coloca um BloomFilter na frente de qualquer estrutura de busca:
+    Trie (search/insert), CompressedTrie (search/insert), LRUCache (get/put, miss=-1)...
+    Chaves que o filtro rejeita nem chegam à estrutura.
+    """
+    def __init__(self, store, capacity, fp_rate=0.01,
+                 lookup="search", insert="insert", miss=False):
+        self.store = store
+        self.bloom = BloomFilter(capacity, fp_rate)
+        self._lookup = getattr(store, lookup)
+        self._insert = getattr(store, insert)
+        self.miss = miss
+
+    def insert(self, key, *args) -> None:
+        self.bloom.add(key)
+        self._insert(key, *args)
+
+    def lookup(self, key):
+        if key not in self.bloom:
+            return self.miss
+        return self._lookup(key)
+
+# Exemplo de uso:
+if __name__ == "__main__":
+    front = BloomFront(Trie(), capacity=100)
+    for p in ["carro", "casa", "cachorro", "gato"]:
+        front.insert(p)
+    print(front.lookup("casa"), front.lookup("cas"))  # True False
+
+    # carga com 95% de misses "difíceis": chaves reais com o último char trocado
+    rnd = random.Random(1)
+    keys = list({"".join(rnd.choice("abcdefghij") for _ in range(12)) for _ in range(100_000)})
+    key_set = set(keys)
+    misses = []
+    while len(misses) < 190_000:
+        k = rnd.choice(keys)
+        k = k[:-1] + rnd.choice("klmnop")
+        if k not in key_set:
+            misses.append(k)
+    workload = misses + rnd.sample(keys, 10_000)
+    rnd.shuffle(workload)
+
+    trie = Trie()
+    for k in keys:
+        trie.insert(k)
+    bloom = BloomFilter(len(keys), fp_rate=0.01)
+    bloom.update(keys)
+    fp = sum(k in bloom for k in misses) / len(misses)
+    print(f"bloom: {len(bloom.bits)} bytes, k={bloom.k}, falsos positivos {fp:.3%}")
+
+    # chaves inteiras (ex.: LRUCache): hash(int) == int, sem o _mix64 daria ~10%
+    int_bloom = BloomFilter(100_000, fp_rate=0.01)
+    int_bloom.update(range(100_000))
+    int_fp = sum(k in int_bloom for k in range(100_000, 300_000)) / 200_000
+    print(f"chaves int sequenciais: falsos positivos {int_fp:.3%}")  # ~1%
+
+    t0 = time.perf_counter()
+    plain = sum(trie.search(k) for k in workload)
+    t1 = time.perf_counter()
+    guarded = sum(k in bloom and trie.search(k) for k in workload)
+    t2 = time.perf_counter()
+    print(plain == guarded, f"speedup {(t1 - t0) / (t2 - t1):.2f}x")  # True
+
+
 # # Union-Find (Disjoint Set)
 class UnionFind:
     def __init__(self, n: int):
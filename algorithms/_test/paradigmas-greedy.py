@@ -48,6 +48,141 @@ if __name__ == "__main__":
     # saída esperada: Min moedas para 6 : 2  (por exemplo, 3+3 ou 4+1+1)
 
 
+# # Troco em lote (tabela pré-calculada)
+# 2b. CoinChangeSolver – DP vetorizada uma vez, consultas O(1)/O(k)
+try:
+    import numpy as np
+except ImportError:  # sem NumPy a tabela é feita com a DP pura
+    np = None
+
+class CoinChangeSolver:
+    """
+    Pré-calcula para todo valor até max_amount o mínimo de moedas (count)
+    e a "última moeda" usada (last), então count(x) é O(1) e coins(x) é
+    O(nº de moedas). Com NumPy, cada moeda c é uma única passada:
+    nas classes de resíduo mod c, dp[t] = min(dp[t], dp[t-1] + 1) vira
+    t + minimum.accumulate(dp[t] - t).
+    Também detecta se o sistema é canônico (greedy sempre ótimo) testando
+    todos os valores abaixo da soma das duas maiores moedas (Kozen–Zaks);
+    se for, valores acima de max_amount são respondidos pelo greedy.
+    """
+    def __init__(self, coins, max_amount):
+        self.denoms = sorted(set(c for c in coins if c > 0))
+        if not self.denoms:
+            raise ValueError("é preciso ao menos uma moeda positiva")
+        self.max_amount = max_amount
+        if np is not None:
+            self._count, self._last = self._build_np(max_amount)
+        else:
+            self._count, self._last = self._build_py(max_amount)
+        self.is_canonical = self._check_canonical()
+
+    def _build_py(self, N):
+        INF = N + 1
+        dp = [0] + [INF] * N
+        last = [0] * (N + 1)
+        for i in range(1, N + 1):
+            for c in self.denoms:
+                if c <= i and dp[i - c] + 1 < dp[i]:
+                    dp[i] = dp[i - c] + 1
+                    last[i] = c
+        return dp, last
+
+    def _build_np(self, N):
+        INF = N + 1
+        dp = np.full(N + 1, INF, dtype=np.int64)
+        dp[0] = 0
+        last = np.zeros(N + 1, dtype=np.int64)
+        for c in self.denoms:
+            T = N // c + 1
+            padded = np.full(T * c, INF, dtype=np.int64)
+            padded[:N + 1] = dp                      # T·c > N sempre
+            x = padded.reshape(T, c)                 # x[t, r] = dp[t·c + r]
+            t = np.arange(T, dtype=np.int64)[:, None]
+            y = t + np.minimum.accumulate(x - t, axis=0)
+            better = (y < x).reshape(-1)[:N + 1]
+            dp = np.minimum(dp, y.reshape(-1)[:N + 1])
+            last[better] = c
+        return dp, last
+
+    def _greedy(self, amount):
+        res = []
+        for c in reversed(self.denoms):
+            k, amount = divmod(amount, c)
+            res.extend([c] * k)
+        return res if amount == 0 else None
+
+    def _check_canonical(self):
+        d = self.denoms
+        if len(d) < 2:
+            return True
+        bound = d[-1] + d[-2]
+        table = self if bound <= self.max_amount else CoinChangeSolver._small(d, bound)
+        for x in range(1, bound):
+            g = self._greedy(x)
+            if table.count(x) != (len(g) if g is not None else -1):
+                return False
+        return True
+
+    @classmethod
+    def _small(cls, coins, max_amount):
+        # tabela auxiliar só para o teste de canonicidade (sem recursão nele)
+        obj = cls.__new__(cls)
+        obj.denoms = sorted(set(coins))
+        obj.max_amount = max_amount
+        obj._count, obj._last = (obj._build_np(max_amount) if np is not None
+                                 else obj._build_py(max_amount))
+        obj.is_canonical = None
+        return obj
+
+    def count(self, amount):
+        """Mínimo de moedas para amount, ou -1 se impossível (ou amount < 0)."""
+        if amount < 0:
+            return -1
+        if amount > self.max_amount:
+            if not self.is_canonical:
+                raise ValueError(f"{amount} > max_amount e o sistema não é canônico")
+            g = self._greedy(amount)
+            return len(g) if g is not None else -1
+        v = int(self._count[amount])
+        return v if v <= self.max_amount else -1
+
+    def coins(self, amount):
+        """Lista de moedas de uma solução ótima, ou None se impossível (ou amount < 0)."""
+        if amount < 0:
+            return None
+        if amount > self.max_amount:
+            if not self.is_canonical:
+                raise ValueError(f"{amount} > max_amount e o sistema não é canônico")
+            return self._greedy(amount)
+        if self.count(amount) < 0:
+            return None
+        res = []
+        while amount:
+            c = int(self._last[amount])
+            res.append(c)
+            amount -= c
+        return res
+
+if __name__ == "__main__":
+    solver = CoinChangeSolver([1, 3, 4], 100)
+    print(solver.count(6), solver.coins(6), solver.is_canonical)  # 2 [3, 3] False
+    euro = CoinChangeSolver([1, 2, 5, 10, 20, 50, 100, 200], 1000)
+    print(euro.is_canonical, euro.coins(388))  # True [200, 100, 50, 20, 10, 5, 2, 1]
+    print(CoinChangeSolver([5, 10], 50).count(7), solver.coins(-5))  # -1 None
+
+    import random, time
+    rnd = random.Random(10)
+    amounts = [rnd.randint(1, 5_000) for _ in range(200)]
+    t0 = time.perf_counter()
+    r1 = [min_coins([1, 7, 13, 29, 31], a) for a in amounts]
+    t1 = time.perf_counter()
+    solver = CoinChangeSolver([1, 7, 13, 29, 31], 100_000)
+    r2 = [solver.count(a) for a in amounts]
+    t2 = time.perf_counter()
+    print(r1 == r2, f"min_coins: {t1 - t0:.2f}s, solver (tabela até 10^5 + consultas): {t2 - t1:.2f}s")
+
+
 # # Huffman Coding
 # 3. Huffman Coding (construção de árvore sem heapq)
 class Node: